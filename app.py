@@ -11,8 +11,12 @@ Enhancements include:
 """
 import sys
 import os
+import hashlib
+import re
+import threading
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
@@ -33,6 +37,12 @@ from src.youtube_api import YouTubeAPI
 from src.sample_data import SampleDataGenerator
 from src.analytics_explanations import AnalyticsExplainer
 
+# Optional JIT acceleration for large channel frames
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 # Page configuration
 st.set_page_config(
@@ -44,7 +54,7 @@ st.set_page_config(
 
 
 # Custom CSS - Colorful and Engaging
-st.markdown("""
+_CSS = """
 <style>
     .main {
         background-color: #0e1117
@@ -103,104 +113,327 @@ st.markdown("""
         background-color: #1e2130;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def _inject_css():
+    """Send the custom CSS to the frontend once per server process."""
+    st.markdown(_CSS, unsafe_allow_html=True)
+    return True
 
 
 @st.cache_data
 def load_data():
-    """Load data from database."""
+    """Load data from database, with derived columns parsed once at the boundary."""
     try:
         df = get_all_video_metrics()
+        if 'published_at' in df.columns:
+            # Parse here so reruns reuse the cached datetime column instead
+            # of re-parsing ISO strings in main() on every pass
+            df['published_at'] = pd.to_datetime(df['published_at'])
+            df['day_of_week'] = df['published_at'].dt.day_name()
+            df['hour'] = df['published_at'].dt.hour
+        if 'engagement_rate' not in df.columns and {'views', 'likes', 'comments'}.issubset(df.columns):
+            df['engagement_rate'] = np.where(
+                df['views'] > 0,
+                (df['likes'] + df['comments']) / df['views'].replace(0, 1) * 100,
+                0.0
+            )
+        # Same downcast as the fetch path: smaller scans and chart payloads
+        for col in ('views', 'likes', 'comments'):
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], downcast='unsigned')
+        if 'engagement_rate' in df.columns:
+            df['engagement_rate'] = df['engagement_rate'].astype('float32')
         return df
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return pd.DataFrame()
 
 
-def fetch_and_analyze_channel(channel_input: str):
-    """Fetch channel data and return analyzed metrics."""
+# Shared layout kwargs for the dashboard charts - built once, applied to
+# every figure instead of repeating the same keys per update_layout call
+_CHART_LAYOUT = dict(
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(30,33,48,1)',
+    font_color='white',
+    height=300,
+    margin=dict(l=20, r=20, t=20, b=20)
+)
+
+# The two trend figures additionally share unified hover
+_TREND_LAYOUT = dict(_CHART_LAYOUT, hovermode='x unified')
+
+# Precompiled title heuristics for the A/B testing tips block - one
+# C-level scan per check instead of a Python loop over substrings
+_DIGIT_RE = re.compile(r'\d')
+_POWER_WORDS_RE = re.compile(r'\b(secret|best|ultimate|proven|exclusive|free|new|instant)\b', re.IGNORECASE)
+_EDUCATIONAL_RE = re.compile(r'how to|tutorial|guide', re.IGNORECASE)
+
+# Epoch day 0 (1970-01-01) was a Thursday, index 3 in this Monday-first list
+DAY_NAMES = np.array(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
+
+# Rows below this threshold stay on the plain vectorized path; the JIT
+# kernel only pays off once the frame is well past the default 150 videos
+JIT_MIN_ROWS = 1000
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _derive_video_stats(views, likes, comments, ts_seconds, out_eng, out_hour, out_dow):
+        """Single-pass derivation of engagement rate, hour, and weekday index."""
+        for i in range(views.shape[0]):
+            v = views[i]
+            out_eng[i] = ((likes[i] + comments[i]) / v * 100.0) if v > 0 else 0.0
+            out_hour[i] = (ts_seconds[i] // 3600) % 24
+            out_dow[i] = (ts_seconds[i] // 86400 + 3) % 7
+
+
+@st.cache_resource
+def get_yt_client() -> YouTubeAPI:
+    """Shared YouTube API client - built once per process, not per rerun."""
+    return YouTubeAPI()
+
+
+@st.cache_resource
+def get_chatbot() -> YouTubeAnalyticsChatbot:
+    """Long-lived chatbot instance so its OpenAI client survives reruns."""
+    return YouTubeAnalyticsChatbot()
+
+
+# Magnitude tiers for format_number, largest first; table-driven so new
+# tiers (e.g. trillions) are one entry, not another if-branch
+_NUMBER_TIERS = ((1e12, 'T'), (1e9, 'B'), (1e6, 'M'), (1e3, 'K'))
+
+
+def format_number(num) -> str:
+    """Format a large number with a K/M/B/T suffix."""
+    for threshold, suffix in _NUMBER_TIERS:
+        if num >= threshold:
+            return f"{num/threshold:.1f}{suffix}"
+    return f"{num:,.0f}"
+
+
+def format_number_array(arr) -> np.ndarray:
+    """Vectorized K/M formatting for a whole numeric column in one pass."""
+    arr = np.asarray(arr, dtype=np.float64)
+    return np.select(
+        [arr >= 1e6, arr >= 1e3],
+        [
+            np.char.add(np.round(arr / 1e6, 1).astype(str), 'M'),
+            np.char.add(np.round(arr / 1e3, 1).astype(str), 'K'),
+        ],
+        default=arr.astype(np.int64).astype(str)
+    )
+
+
+def _channel_name() -> str:
+    """Channel display name from session state, with a friendly default."""
+    return st.session_state.get('channel_info', {}).get('channel_name', 'Your Channel')
+
+
+def _df_cache_key(df: pd.DataFrame) -> tuple:
+    """Cheap stand-in key for a channel frame: id, row count, newest publish."""
+    channel_id = st.session_state.get('channel_info', {}).get('channel_id', '')
+    newest = str(df['published_at'].max()) if 'published_at' in df.columns and len(df) else ''
+    return (channel_id, len(df), newest)
+
+
+@st.cache_data(show_spinner=False)
+def _dashboard_stats(df_key: tuple, _df: pd.DataFrame) -> tuple:
+    """Dashboard aggregates, cached on df_key so reruns skip the pandas work."""
+    metrics = AnalyticsMetrics(_df)
+    return metrics.get_summary_stats(), metrics.get_performance_by_day(), metrics.get_top_videos(5)
+
+
+# Quick Action buttons on the chatbot page: (widget key, label, canned prompt)
+QUICK_ACTIONS = (
+    ("btn_views", "📊 Total Views", "What is my total views?"),
+    ("btn_top", "🏆 Top Videos", "Show me my top 5 videos"),
+    ("btn_time", "📅 Best Time to Post", "When should I post?"),
+    ("btn_rec", "💡 Recommendations", "Give me recommendations for my channel"),
+    ("btn_growth", "📈 Growth Trend", "What is my growth trend?"),
+    ("btn_content", "🎨 Best Content", "What content works best?"),
+    ("btn_audience", "👥 Audience Info", "Tell me about my audience"),
+    ("btn_benchmark", "🏆 Benchmark", "Compare my performance to industry benchmarks"),
+)
+
+
+# Sessions run in separate threads but share one cache_resource chatbot,
+# so binding a frame and computing from it must be atomic — otherwise
+# another session's set_df lands in between and the answer is computed
+# from the wrong channel's data
+_chatbot_lock = threading.Lock()
+
+
+def _chat_on(df_key: tuple, df: pd.DataFrame, method: str, *args):
+    """Run a chatbot method against a specific data snapshot, serialized."""
+    chatbot = get_chatbot()
+    with _chatbot_lock:
+        chatbot.set_df(df, version=df_key)
+        return getattr(chatbot, method)(*args)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_chat(df_key: tuple, _df: pd.DataFrame, prompt: str) -> dict:
+    """Canned chatbot answers, cached per (data snapshot, prompt)."""
+    return _chat_on(df_key, _df, 'process_message', prompt)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_pdf(df_key: tuple, _df: pd.DataFrame) -> bytes:
+    """Full analytics report bytes, rendered once per data snapshot."""
+    return _chat_on(df_key, _df, 'generate_pdf_report')
+
+
+@st.cache_data(show_spinner=False)
+def _cached_compare_thumbnails(hash_a: bytes, hash_b: bytes, _bytes_a: bytes, _bytes_b: bytes) -> dict:
+    """Thumbnail comparison keyed on small content digests, not image bytes.
+
+    compare_thumbnails is pure image analysis, so the simulator needs no
+    channel data here.
+    """
+    return ABTestSimulator(pd.DataFrame()).compare_thumbnails(_bytes_a, _bytes_b)
+
+
+@st.cache_data(show_spinner=False)
+def _pattern_stats(df_key: tuple, _df: pd.DataFrame) -> tuple:
+    """Pattern-detection results, cached per data snapshot."""
+    detector = PatternDetection(_df)
+    return (
+        detector.detect_content_themes(),
+        detector.detect_title_length_patterns(),
+        detector.detect_upload_consistency(),
+    )
+
+
+class ChannelFetchError(RuntimeError):
+    """A channel fetch or lookup failed; raised (not returned) so
+    st.cache_data never caches the failure for the TTL."""
+
+
+@st.cache_data(ttl=86400)
+def resolve_channel_id(channel_input: str):
+    """Resolve a channel name or ID to (channel_id, channel_name).
+
+    IDs pass straight through; names cost one search.list call, cached for
+    a day so repeated fetches of the same input don't re-spend quota.
+    Raises ChannelFetchError when the search finds nothing, so a transient
+    empty response isn't pinned as "not found" for the whole TTL.
+    """
+    if channel_input.startswith('UC'):
+        return channel_input, None
+
+    yt = get_yt_client()
+    results = yt.youtube.search().list(
+        part='snippet',
+        q=channel_input,
+        type='channel',
+        maxResults=1
+    ).execute()
+
+    if results.get('items'):
+        item = results['items'][0]
+        return item['id']['channelId'], item['snippet']['title']
+    raise ChannelFetchError("Channel not found.")
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_and_analyze_channel(channel_id: str):
+    """Fetch channel data and return analyzed metrics.
+
+    Cached per resolved channel_id so reruns within a session skip the
+    YouTube API pipeline entirely. Callers resolve names to IDs first.
+    Raises ChannelFetchError on failure: a transient API error must stay
+    retryable instead of pinning a None in the cache for an hour.
+    """
     try:
-        yt = YouTubeAPI()
-        
-        # Try to search for channel if it's a name
-        if not channel_input.startswith('UC'):
-            results = yt.youtube.search().list(
-                part='snippet',
-                q=channel_input,
-                type='channel',
-                maxResults=1
-            ).execute()
-            
-            if results.get('items'):
-                channel_id = results['items'][0]['id']['channelId']
-            else:
-                st.error("Channel not found. Please check the channel name.")
-                return None
-        else:
-            channel_id = channel_input
-        
+        yt = get_yt_client()
+
         # Get channel info
         channel_info = yt.get_channel_info(channel_id)
         if not channel_info:
-            st.error("Could not fetch channel information.")
-            return None
-        
-        # Get videos with stats (now fetches 150 videos)
-        videos = yt.get_uploaded_videos(channel_info['uploads_playlist_id'], max_results=150)
-        
+            raise ChannelFetchError("Could not fetch channel information.")
+
+        # Get videos with stats (now fetches 150 videos over one session)
+        videos = yt.get_uploaded_videos_concurrent(channel_info['uploads_playlist_id'], max_results=150)
+
         if not videos:
-            st.error("No videos found for this channel.")
-            return None
-        
+            raise ChannelFetchError("No videos found for this channel.")
+
         # Get video IDs
         video_ids = [v['video_id'] for v in videos]
-        
-        # Fetch all video statistics in batch
-        video_details = yt.get_video_details(video_ids)
-        
+
+        # Fetch all video statistics with the 50-ID batches issued concurrently
+        video_details = yt.get_video_details_concurrent(video_ids)
+
         if video_details.empty:
-            st.error("Could not fetch video statistics.")
-            return None
-        
-        # Prepare data with all required columns
-        data = []
-        for _, row in video_details.iterrows():
-            views = row['views']
-            likes = row['likes']
-            comments = row['comments']
-            
-            engagement_rate = ((likes + comments) / views * 100) if views > 0 else 0
-            
-            data.append({
-                'video_id': row['video_id'],
-                'title': row['title'],
-                'published_at': row['published_at'],
-                'views': views,
-                'likes': likes,
-                'comments': comments,
-                'engagement_rate': engagement_rate,
-                'subscribers': 0,
-                'day_of_week': pd.to_datetime(row['published_at']).day_name(),
-                'hour': pd.to_datetime(row['published_at']).hour,
-            })
-        
-        df = pd.DataFrame(data)
-        
-        # Save to database
-        try:
-            save_video_metrics(df)
-        except Exception as e:
-            st.warning(f"Could not save to database: {e}")
+            raise ChannelFetchError("Could not fetch video statistics.")
+
+        # Prepare data with all required columns (vectorized, no per-row iteration)
+        df = video_details[['video_id', 'title', 'published_at', 'views', 'likes', 'comments']].copy()
+
+        published = pd.to_datetime(df['published_at'])
+
+        if njit is not None and len(df) >= JIT_MIN_ROWS:
+            # Fused single-pass kernel over raw arrays for large frames
+            n = len(df)
+            ts_seconds = published.to_numpy('datetime64[s]').astype('int64')
+            out_eng = np.empty(n, dtype=np.float64)
+            out_hour = np.empty(n, dtype=np.int64)
+            out_dow = np.empty(n, dtype=np.int64)
+            _derive_video_stats(
+                df['views'].to_numpy(dtype=np.int64),
+                df['likes'].to_numpy(dtype=np.int64),
+                df['comments'].to_numpy(dtype=np.int64),
+                ts_seconds, out_eng, out_hour, out_dow
+            )
+            df['day_of_week'] = DAY_NAMES[out_dow]
+            df['hour'] = out_hour
+            df['engagement_rate'] = out_eng
+        else:
+            df['day_of_week'] = published.dt.day_name()
+            df['hour'] = published.dt.hour
+
+            views = df['views'].to_numpy()
+            df['engagement_rate'] = np.where(
+                views > 0,
+                (df['likes'].to_numpy() + df['comments'].to_numpy()) / np.where(views > 0, views, 1) * 100,
+                0.0
+            )
+        df['subscribers'] = 0
+
+        # Downcast before storing: halves bytes moved during cache hashing
+        # and chart serialization, with no loss at these magnitudes
+        for col in ('views', 'likes', 'comments'):
+            df[col] = pd.to_numeric(df[col], downcast='unsigned')
+        df['engagement_rate'] = df['engagement_rate'].astype('float32')
+        df['hour'] = df['hour'].astype('int8')
+
+        # Arrow-backed strings and a fixed-order categorical keep these
+        # columns off object dtype, so day groupbys skip the Python fallback
+        for col in ('video_id', 'title'):
+            df[col] = df[col].astype('string[pyarrow]')
+        df['day_of_week'] = pd.Categorical(df['day_of_week'], categories=list(DAY_NAMES), ordered=True)
+
+        # Save to database (skip the round-trip entirely for empty frames)
+        if not df.empty:
+            try:
+                save_video_metrics(df)
+            except Exception as e:
+                st.warning(f"Could not save to database: {e}")
         
         return df
-        
+
+    except ChannelFetchError:
+        raise
     except Exception as e:
-        st.error(f"Error fetching data: {e}")
-        return None
+        raise ChannelFetchError(f"Error fetching data: {e}") from e
 
 
 def main():
     """Main application."""
+    _inject_css()
     st.title("📊 YouTube Analytics Dashboard")
     st.caption("Use these metrics to see what works and improve your channel growth—post when it counts, double down on what performs, and test titles and thumbnails.")
     
@@ -225,9 +458,7 @@ def main():
     
     # Clear data button
     if st.sidebar.button("🗑️ Clear Data"):
-        keys_to_remove = [key for key in st.session_state.keys()]
-        for key in keys_to_remove:
-            del st.session_state[key]
+        st.session_state.clear()
         st.rerun()
     
     # Display current channel if loaded
@@ -256,42 +487,24 @@ def main():
                 st.error("Please enter a channel name!")
             else:
                 with st.spinner("Fetching channel data..."):
-                    # Get channel info first
-                    yt = YouTubeAPI()
-                    
-                    # Search for channel if needed
-                    if not channel_input.startswith('UC'):
-                        results = yt.youtube.search().list(
-                            part='snippet',
-                            q=channel_input,
-                            type='channel',
-                            maxResults=1
-                        ).execute()
-                        
-                        if results.get('items'):
-                            channel_id = results['items'][0]['id']['channelId']
-                            channel_name = results['items'][0]['snippet']['title']
-                        else:
-                            st.error("Channel not found. Please check the channel name.")
-                            channel_id = None
-                            channel_name = None
-                    else:
-                        channel_id = channel_input
-                        channel_name = None
-                    
-                    if channel_id:
+                    try:
+                        # Resolve name/ID once through the cached helper
+                        channel_id, channel_name = resolve_channel_id(channel_input)
+
                         # Get full channel info
-                        info = yt.get_channel_info(channel_id)
+                        info = get_yt_client().get_channel_info(channel_id)
                         if info:
                             channel_name = info.get('channel_name', channel_name)
                             st.session_state['channel_info'] = info
-                        
-                        df = fetch_and_analyze_channel(channel_input)
-                        if df is not None:
-                            st.session_state['df'] = df
-                            st.success(f"✅ Loaded {len(df)} videos from {channel_name or channel_input}!")
-                        else:
-                            st.error("Failed to fetch data. Check the channel name and try again.")
+
+                        df = fetch_and_analyze_channel(channel_id)
+                    except ChannelFetchError as e:
+                        st.error(f"{e} Check the channel name and try again.")
+                    else:
+                        st.session_state['df'] = df
+                        # Sort once at load; renders slice instead of re-sorting
+                        st.session_state['df_sorted_time'] = df.sort_values('published_at')
+                        st.success(f"✅ Loaded {len(df)} videos from {channel_name or channel_input}!")
 
     # If no data, show message
     if df.empty:
@@ -309,12 +522,13 @@ def main():
     # Prepare current_df with required columns
     current_df = df.copy()
     
-    # Add required columns if missing
-    if 'published_at' in current_df.columns:
+    # Add required columns if missing (parse published_at once for both)
+    if 'published_at' in current_df.columns and ('day_of_week' not in current_df.columns or 'hour' not in current_df.columns):
+        published = pd.to_datetime(current_df['published_at'])
         if 'day_of_week' not in current_df.columns:
-            current_df['day_of_week'] = pd.to_datetime(current_df['published_at']).dt.day_name()
+            current_df['day_of_week'] = published.dt.day_name()
         if 'hour' not in current_df.columns:
-            current_df['hour'] = pd.to_datetime(current_df['published_at']).dt.hour
+            current_df['hour'] = published.dt.hour
     
     # Calculate engagement rate if missing
     if 'engagement_rate' not in current_df.columns:
@@ -343,51 +557,133 @@ def main():
         render_chatbot(current_df)
 
 
+@st.fragment
+def _views_trend_chart(xs, y_views):
+    """Views trend for the last 20 videos; reruns independently as a fragment."""
+    st.markdown("**📈 Views Trend (Last 20 Videos)**")
+    fig_views = go.Figure()
+    fig_views.add_trace(go.Scatter(
+        x=xs,
+        y=y_views,
+        mode='lines+markers',
+        name='Views',
+        fill='tozeroy',
+        line=dict(color='#4CAF50', width=3),
+        marker=dict(size=8, color='#4CAF50', symbol='circle')
+    ))
+    fig_views.update_layout(
+        **_TREND_LAYOUT,
+        xaxis_title="Video #",
+        yaxis_title="Views"
+    )
+    fig_views.update_yaxes(tickformat=',')
+    st.plotly_chart(fig_views, use_container_width=True)
+
+
+@st.fragment
+def _engagement_trend_chart(xs, y_eng):
+    """Engagement trend for the last 20 videos, as an independent fragment."""
+    st.markdown("**❤️ Engagement Trend (Last 20 Videos)**")
+    fig_eng = go.Figure()
+    fig_eng.add_trace(go.Scatter(
+        x=xs,
+        y=y_eng,
+        mode='lines+markers',
+        name='Engagement',
+        fill='tozeroy',
+        line=dict(color='#FF9800', width=3),
+        marker=dict(size=8, color='#FF9800', symbol='circle')
+    ))
+    fig_eng.update_layout(
+        **_TREND_LAYOUT,
+        xaxis_title="Video #",
+        yaxis_title="Engagement %"
+    )
+    fig_eng.update_yaxes(tickformat='.1f')
+    st.plotly_chart(fig_eng, use_container_width=True)
+
+
+@st.fragment
+def _day_performance_chart(day_perf):
+    """Average views per weekday, as an independent fragment."""
+    st.markdown("**📅 Performance by Day of Week**")
+    if not day_perf.empty:
+        # get_performance_by_day already returns Monday-first rows;
+        # 7 fixed rows don't need a plotly round-trip
+        day_views = day_perf.set_index('day_of_week')['views']
+        # sort=False keeps the weekday order; the default re-sorts the
+        # axis labels alphabetically
+        st.bar_chart(day_views, height=300, color='#4CAF50', sort=False)
+
+
+@st.fragment
+def _views_likes_scatter(df):
+    """Views-vs-likes scatter over the whole channel, as a fragment."""
+    st.markdown("**🏆 Views vs Likes Scatter**")
+    # WebGL trace: stays fast for channels with hundreds of videos,
+    # where SVG markers from px.scatter start to stall the browser
+    eng = df['engagement_rate'].to_numpy(dtype=np.float32)
+    fig_scatter = go.Figure(go.Scattergl(
+        x=df['views'].to_numpy(),
+        y=df['likes'].to_numpy(),
+        mode='markers',
+        marker=dict(
+            size=np.sqrt(np.clip(eng, 0, None)) * 3 + 4,
+            color=eng,
+            colorscale='RdYlGn',
+            showscale=True
+        ),
+        text=df['title'].to_numpy(dtype=object),
+        hovertemplate='%{text}<br>Views: %{x:,}<br>Likes: %{y:,}<extra></extra>'
+    ))
+    fig_scatter.update_layout(
+        **_CHART_LAYOUT,
+        xaxis_title="Views",
+        yaxis_title="Likes"
+    )
+    fig_scatter.update_xaxes(tickformat=',')
+    fig_scatter.update_yaxes(tickformat=',')
+    st.plotly_chart(fig_scatter, use_container_width=True)
+
+
 def render_dashboard(df):
     """Render dashboard page with improved charts."""
-    
-    # Get channel info from session state
-    channel_info = st.session_state.get('channel_info', {})
-    channel_name = channel_info.get('channel_name', 'Your Channel')
-    
+    channel_name = _channel_name()
+
     st.header(f"📊 {channel_name} - Channel Overview")
     
-    # Calculate metrics
-    metrics = AnalyticsMetrics(df)
-    summary = metrics.get_summary_stats()
+    # Calculate metrics (cached; reruns are O(1) lookups)
+    summary, day_perf, top_videos = _dashboard_stats(_df_cache_key(df), df)
     
     # Key metrics - Using Streamlit native columns with abbreviations
     st.markdown("### 📊 Channel Performance Summary")
     st.caption("Quick snapshot of your overall channel performance and growth.")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
     total_videos = summary.get('total_videos', 0)
     total_views = summary.get('total_views', 0)
     total_likes = summary.get('total_likes', 0)
     avg_engagement = summary.get('avg_engagement_rate', 0)
-    
-    # Format large numbers with K/M suffixes
-    def format_number(num):
-        if num >= 1_000_000:
-            return f"{num/1_000_000:.1f}M"
-        elif num >= 1_000:
-            return f"{num/1_000:.1f}K"
-        else:
-            return f"{num:,.0f}"
-    
-    with col1:
-        st.metric("🎬 Videos", f"{total_videos}")
-        st.caption("Total videos analyzed")
-    with col2:
-        st.metric("👀 Views", format_number(total_views))
-        st.caption("Total video views")
-    with col3:
-        st.metric("👍 Likes", format_number(total_likes))
-        st.caption("Total thumbs up")
-    with col4:
-        st.metric("❤️ Engagement", f"{avg_engagement:.1f}%")
-        st.caption("(Likes+Comments)/Views × 100")
+
+    # One markdown grid instead of eight metric/caption messages
+    metric_rows = (
+        ("🎬 Videos", f"{total_videos}", "Total videos analyzed"),
+        ("👀 Views", format_number(total_views), "Total video views"),
+        ("👍 Likes", format_number(total_likes), "Total thumbs up"),
+        ("❤️ Engagement", f"{avg_engagement:.1f}%", "(Likes+Comments)/Views × 100"),
+    )
+    metrics_html = (
+        '<div style="display:grid;grid-template-columns:repeat(4,1fr);gap:12px;">'
+        + "".join(
+            f'<div class="stMetric">'
+            f'<div class="metric-label">{label}</div>'
+            f'<div class="metric-value" style="font-size:1.9em;font-weight:600;">{value}</div>'
+            f'<div style="color:#9ca3af;font-size:0.8em;">{caption}</div>'
+            f'</div>'
+            for label, value, caption in metric_rows
+        )
+        + '</div>'
+    )
+    st.markdown(metrics_html, unsafe_allow_html=True)
     
     # Improved Charts Section
     st.markdown("---")
@@ -395,134 +691,68 @@ def render_dashboard(df):
     # Create two columns for charts
     chart_col1, chart_col2 = st.columns(2)
     
-    # Prepare data for charts
-    df_sorted = df.sort_values('published_at').tail(20)  # Last 20 videos
-    
+    # Prepare data for charts: reuse the pre-sorted frame from the load path
+    df_sorted_time = st.session_state.get('df_sorted_time')
+    if df_sorted_time is not None and len(df_sorted_time) == len(df):
+        idx = df_sorted_time.index.to_numpy()[-20:]
+    else:
+        # No pre-sorted frame: select-then-sort the newest 20 rows instead
+        # of sorting the whole column (argpartition is O(n))
+        times = df['published_at'].to_numpy('datetime64[ns]')
+        if len(times) > 20:
+            idx = np.argpartition(times, -20)[-20:]
+            idx = idx[np.argsort(times[idx])]
+        else:
+            idx = np.argsort(times)
+        idx = df.index.to_numpy()[idx]
+
+    # Extract the shared trace arrays once; both trend figures reuse them
+    xs = np.arange(len(idx), dtype=np.int16)
+    y_views = df['views'].loc[idx].to_numpy()
+    y_eng = df['engagement_rate'].loc[idx].to_numpy()
+
     with chart_col1:
-        st.markdown("**📈 Views Trend (Last 20 Videos)**")
-        fig_views = go.Figure()
-        fig_views.add_trace(go.Scatter(
-            x=list(range(len(df_sorted))),
-            y=df_sorted['views'].values,
-            mode='lines+markers',
-            name='Views',
-            fill='tozeroy',
-            line=dict(color='#4CAF50', width=3),
-            marker=dict(size=8, color='#4CAF50', symbol='circle')
-        ))
-        fig_views.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(30,33,48,1)',
-            font_color='white',
-            xaxis_title="Video #",
-            yaxis_title="Views",
-            hovermode='x unified',
-            height=300,
-            margin=dict(l=20, r=20, t=20, b=20)
-        )
-        fig_views.update_yaxes(tickformat=',')
-        st.plotly_chart(fig_views, use_container_width=True)
-    
+        _views_trend_chart(xs, y_views)
+
     with chart_col2:
-        st.markdown("**❤️ Engagement Trend (Last 20 Videos)**")
-        fig_eng = go.Figure()
-        fig_eng.add_trace(go.Scatter(
-            x=list(range(len(df_sorted))),
-            y=df_sorted['engagement_rate'].values,
-            mode='lines+markers',
-            name='Engagement',
-            fill='tozeroy',
-            line=dict(color='#FF9800', width=3),
-            marker=dict(size=8, color='#FF9800', symbol='circle')
-        ))
-        fig_eng.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(30,33,48,1)',
-            font_color='white',
-            xaxis_title="Video #",
-            yaxis_title="Engagement %",
-            hovermode='x unified',
-            height=300,
-            margin=dict(l=20, r=20, t=20, b=20)
-        )
-        fig_eng.update_yaxes(tickformat='.1f')
-        st.plotly_chart(fig_eng, use_container_width=True)
-    
+        _engagement_trend_chart(xs, y_eng)
+
     # Additional charts row
     chart_col3, chart_col4 = st.columns(2)
-    
+
     with chart_col3:
-        st.markdown("**📅 Performance by Day of Week**")
-        day_perf = metrics.get_performance_by_day()
-        if not day_perf.empty:
-            # Order days correctly
-            day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            day_perf['day_of_week'] = pd.Categorical(day_perf['day_of_week'], categories=day_order, ordered=True)
-            day_perf = day_perf.sort_values('day_of_week')
-            
-            fig_day = px.bar(
-                day_perf, 
-                x='day_of_week', 
-                y='views',
-                color='views',
-                color_continuous_scale='Viridis'
-            )
-            fig_day.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(30,33,48,1)',
-                font_color='white',
-                xaxis_title="Day",
-                yaxis_title="Avg Views",
-                height=300,
-                margin=dict(l=20, r=20, t=20, b=20),
-                coloraxis_showscale=False
-            )
-            fig_day.update_yaxes(tickformat=',')
-            st.plotly_chart(fig_day, use_container_width=True)
-    
+        _day_performance_chart(day_perf)
+
     with chart_col4:
-        st.markdown("**🏆 Views vs Likes Scatter**")
-        fig_scatter = px.scatter(
-            df, 
-            x='views', 
-            y='likes',
-            size='engagement_rate',
-            hover_name='title',
-            color='engagement_rate',
-            color_continuous_scale='RdYlGn',
-            size_max=30
-        )
-        fig_scatter.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(30,33,48,1)',
-            font_color='white',
-            xaxis_title="Views",
-            yaxis_title="Likes",
-            height=300,
-            margin=dict(l=20, r=20, t=20, b=20)
-        )
-        fig_scatter.update_xaxes(tickformat=',')
-        fig_scatter.update_yaxes(tickformat=',')
-        st.plotly_chart(fig_scatter, use_container_width=True)
-    
+        _views_likes_scatter(df)
+
     # Top 5 Videos with conditional formatting
     st.markdown("---")
     st.subheader("🏆 Top 5 Videos")
     st.caption("Your best-performing videos based on views and engagement.")
     
-    top_videos = metrics.get_top_videos(5)
     if not top_videos.empty:
+        # Progress columns convey the same ranking as the old Styler
+        # gradient without pulling in matplotlib or per-cell CSS
         st.dataframe(
-            top_videos[['title', 'views', 'likes', 'engagement_rate']].head(5)
-            .style.background_gradient(subset=['views', 'likes'], cmap='Greens'),
-            use_container_width=True
+            top_videos[['title', 'views', 'likes', 'engagement_rate']].head(5),
+            use_container_width=True,
+            column_config={
+                'views': st.column_config.ProgressColumn(
+                    'Views', format='%d', min_value=0,
+                    max_value=int(top_videos['views'].max() or 1)
+                ),
+                'likes': st.column_config.ProgressColumn(
+                    'Likes', format='%d', min_value=0,
+                    max_value=int(top_videos['likes'].max() or 1)
+                ),
+            }
         )
 
 def render_forecasting(df):
     """Render forecasting page with explanations."""
-    channel_info = st.session_state.get('channel_info', {})
-    channel_name = channel_info.get('channel_name', 'Your Channel')
-    
+    channel_name = _channel_name()
+
     st.header(f"🔮 {channel_name} - Growth Forecasting")
     
     # Check if we have enough data
@@ -670,9 +900,8 @@ def render_forecasting(df):
 
 def render_calendar_optimizer(df):
     """Render calendar optimizer page with explanations."""
-    channel_info = st.session_state.get('channel_info', {})
-    channel_name = channel_info.get('channel_name', 'Your Channel')
-    
+    channel_name = _channel_name()
+
     st.header(f"📅 {channel_name} - Content Calendar Optimizer")
     
     # Check if we have enough data
@@ -836,9 +1065,8 @@ def render_calendar_optimizer(df):
 
 def render_pattern_detection(df):
     """Render pattern detection page with explanations."""
-    channel_info = st.session_state.get('channel_info', {})
-    channel_name = channel_info.get('channel_name', 'Your Channel')
-    
+    channel_name = _channel_name()
+
     st.header(f"🔍 {channel_name} - Content Pattern Detection")
     
     # Check if we have enough data
@@ -865,7 +1093,7 @@ def render_pattern_detection(df):
         """)
     
     try:
-        detector = PatternDetection(df)
+        themes, title_patterns, consistency = _pattern_stats(_df_cache_key(df), df)
     except Exception as e:
         st.error(f"Error initializing pattern detection: {str(e)}")
         return
@@ -875,19 +1103,15 @@ def render_pattern_detection(df):
     st.caption("Themes detected from your specific video titles - based on recurring keywords")
     
     try:
-        themes = detector.detect_content_themes()
         if themes:
-            theme_data = []
-            for theme in themes:
-                theme_data.append({
-                    'Theme': theme.get('theme', 'Unknown'),
-                    'Videos': theme.get('count', 0),
-                    'Avg Views': theme.get('avg_views', 0),
-                    'Example': theme.get('example_title', '')[:40] + '...',
-                    'Performance': theme.get('performance', 'N/A')
-                })
-            
-            theme_df = pd.DataFrame(theme_data)
+            # Column-wise construction: one frame build, no per-row inference
+            theme_df = pd.DataFrame({
+                'Theme': [t.get('theme', 'Unknown') for t in themes],
+                'Videos': [t.get('count', 0) for t in themes],
+                'Avg Views': format_number_array([t.get('avg_views', 0) for t in themes]),
+                'Example': [t.get('example_title', '')[:40] + '...' for t in themes],
+                'Performance': [t.get('performance', 'N/A') for t in themes],
+            })
             st.dataframe(theme_df, use_container_width=True)
             AnalyticsExplainer.render_info_button("content_themes", expanded=False)
         else:
@@ -900,17 +1124,12 @@ def render_pattern_detection(df):
     st.caption("How title length affects video performance")
     
     try:
-        title_patterns = detector.detect_title_length_patterns()
         if title_patterns and 'error' not in title_patterns:
-            title_data = []
-            for bucket, stats in title_patterns.items():
-                title_data.append({
-                    'Title Length': bucket,
-                    'Avg Views': stats.get('avg_views', 0),
-                    'Video Count': stats.get('count', 0)
-                })
-            
-            title_df = pd.DataFrame(title_data)
+            title_df = pd.DataFrame({
+                'Title Length': list(title_patterns.keys()),
+                'Avg Views': [s.get('avg_views', 0) for s in title_patterns.values()],
+                'Video Count': [s.get('count', 0) for s in title_patterns.values()],
+            })
             
             fig = px.bar(title_df, x='Title Length', y='Avg Views',
                         title='Average Views by Title Length 📝',
@@ -927,7 +1146,6 @@ def render_pattern_detection(df):
     st.subheader("📅 Upload Consistency")
     
     try:
-        consistency = detector.detect_upload_consistency()
         if consistency and 'error' not in consistency:
             col1, col2 = st.columns(2)
             with col1:
@@ -944,9 +1162,8 @@ def render_pattern_detection(df):
 
 def render_ab_testing(df):
     """Render A/B testing page."""
-    channel_info = st.session_state.get('channel_info', {})
-    channel_name = channel_info.get('channel_name', 'Your Channel')
-    
+    channel_name = _channel_name()
+
     st.header(f"🧪 {channel_name} - A/B Testing Simulator")
     
     # Context about the analysis
@@ -995,16 +1212,14 @@ def render_ab_testing(df):
             else:
                 st.info(f"### 🤝 Similar Performance (±{abs(expected_change):.1f}% difference)")
             
-            # Metrics display
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Expected Change", f"{expected_change:+.1f}%")
-            with col2:
-                confidence = result.get('confidence', 'N/A')
-                st.metric("Confidence Level", confidence)
-            with col3:
-                pattern_count = len(result.get('pattern_details', []))
-                st.metric("Patterns Detected", pattern_count)
+            # Metrics display - one tuple-driven loop instead of per-column blocks
+            result_metrics = (
+                ("Expected Change", f"{expected_change:+.1f}%"),
+                ("Confidence Level", result.get('confidence', 'N/A')),
+                ("Patterns Detected", len(result.get('pattern_details', []))),
+            )
+            for col, (label, value) in zip(st.columns(3), result_metrics):
+                col.metric(label, value)
             
             # Detailed analysis
             st.markdown("---")
@@ -1014,17 +1229,15 @@ def render_ab_testing(df):
             pattern_details = result.get('pattern_details', [])
             if pattern_details:
                 st.markdown("**Title Pattern Changes Detected:**")
-                
-                for detail in pattern_details:
-                    change_icon = "➕" if detail['change'] == 'Added' else "➖"
-                    impact_color = "green" if detail['expected_impact'] > 0 else "red"
-                    impact_sign = "+" if detail['expected_impact'] > 0 else ""
-                    
-                    st.markdown(
-                        f"{change_icon} **{detail['change']}** '{detail['pattern']}' — "
-                        f"Expected impact: :{impact_color}[{impact_sign}{detail['expected_impact']:.1f}%] "
-                        f"(Confidence: {detail['confidence']})"
-                    )
+
+                # One markdown delta for the whole list instead of one per row
+                st.markdown("\n\n".join(
+                    f"{'➕' if detail['change'] == 'Added' else '➖'} **{detail['change']}** '{detail['pattern']}' — "
+                    f"Expected impact: :{'green' if detail['expected_impact'] > 0 else 'red'}"
+                    f"[{'+' if detail['expected_impact'] > 0 else ''}{detail['expected_impact']:.1f}%] "
+                    f"(Confidence: {detail['confidence']})"
+                    for detail in pattern_details
+                ))
             else:
                 st.info("ℹ️ No significant title pattern differences detected between these titles. Try making more distinct changes (e.g., add numbers, questions, or power words).")
             
@@ -1056,10 +1269,9 @@ def render_ab_testing(df):
             st.subheader("🎯 Title Improvement Tips")
             
             tips = []
-            title_lower = title_b.lower()
-            
+
             # Check for best practices
-            if not any(c.isdigit() for c in title_b):
+            if not _DIGIT_RE.search(title_b):
                 tips.append("🔢 Add numbers to your title (e.g., '5 Tips', '10 Ways') — numbers increase CTR by 15-20%")
             
             if '?' not in title_b:
@@ -1070,19 +1282,16 @@ def render_ab_testing(df):
             elif len(title_b) > 80:
                 tips.append("✂️ Title B is long. Consider shortening to 50-70 characters so it doesn't get cut off")
             
-            power_words = ['secret', 'best', 'ultimate', 'proven', 'exclusive', 'free', 'new', 'instant']
-            has_power_word = any(word in title_lower for word in power_words)
-            if not has_power_word:
+            if not _POWER_WORDS_RE.search(title_b):
                 tips.append("⚡ Add power words like 'Secret', 'Best', 'Proven', or 'Ultimate' to increase emotional response")
-            
-            if 'how to' not in title_lower and 'tutorial' not in title_lower and 'guide' not in title_lower:
+
+            if not _EDUCATIONAL_RE.search(title_b):
                 tips.append("📚 For educational content, include 'How to' or 'Guide' to signal value")
             
             if not tips:
                 tips.append("✅ Title B follows good practices! Test it and see how it performs.")
-            
-            for tip in tips:
-                st.markdown(f"- {tip}")
+
+            st.markdown("\n".join(f"- {tip}" for tip in tips))
     
     # Thumbnail A/B Test with upload
     st.markdown("---")
@@ -1107,9 +1316,15 @@ def render_ab_testing(df):
                     # Read thumbnail data
                     thumb_a_data = thumb_a.getvalue()
                     thumb_b_data = thumb_b.getvalue()
-                    
-                    # Compare thumbnails
-                    result = simulator.compare_thumbnails(thumb_a_data, thumb_b_data)
+
+                    # Compare thumbnails (cached per content digest, so
+                    # re-submitting the same images skips the PIL pipeline)
+                    result = _cached_compare_thumbnails(
+                        hashlib.blake2b(thumb_a_data, digest_size=16).digest(),
+                        hashlib.blake2b(thumb_b_data, digest_size=16).digest(),
+                        thumb_a_data,
+                        thumb_b_data
+                    )
                     
                     if 'error' in result:
                         st.error(f"Analysis error: {result['error']}")
@@ -1142,8 +1357,7 @@ def render_ab_testing(df):
                         with comp_col1:
                             st.markdown("**Thumbnail A Analysis:**")
                             reasons_a = result.get('reasons_a', [])
-                            for reason in reasons_a:
-                                st.markdown(f"✅ {reason}")
+                            st.markdown("\n\n".join(f"✅ {reason}" for reason in reasons_a))
                             
                             analysis_a = result.get('analysis_a', {})
                             with st.expander("Technical Details"):
@@ -1157,8 +1371,7 @@ def render_ab_testing(df):
                         with comp_col2:
                             st.markdown("**Thumbnail B Analysis:**")
                             reasons_b = result.get('reasons_b', [])
-                            for reason in reasons_b:
-                                st.markdown(f"✅ {reason}")
+                            st.markdown("\n\n".join(f"✅ {reason}" for reason in reasons_b))
                             
                             analysis_b = result.get('analysis_b', {})
                             with st.expander("Technical Details"):
@@ -1173,8 +1386,7 @@ def render_ab_testing(df):
                         st.markdown("---")
                         st.subheader("💡 Improvement Tips")
                         tips = result.get('improvement_tips', [])
-                        for tip in tips:
-                            st.markdown(f"- {tip}")
+                        st.markdown("\n".join(f"- {tip}" for tip in tips))
                         
                 except Exception as e:
                     st.error(f"Failed to analyze thumbnails: {str(e)}")
@@ -1193,9 +1405,8 @@ def render_ab_testing(df):
 
 def render_chatbot(df):
     """Render AI chatbot page with improved UI."""
-    channel_info = st.session_state.get('channel_info', {})
-    channel_name = channel_info.get('channel_name', 'Your Channel')
-    
+    channel_name = _channel_name()
+
     st.header(f"🤖 {channel_name} - AI Analytics Assistant")
     st.caption("Get clear answers and actionable next steps so you can grow your channel.")
     
@@ -1213,62 +1424,24 @@ def render_chatbot(df):
     - "What's my growth trend?" / "Compare to benchmarks"
     """)
     
-    # Initialize chatbot with current data
-    if 'chatbot' not in st.session_state:
-        st.session_state.chatbot = YouTubeAnalyticsChatbot(df)
-    else:
-        # Update chatbot with fresh data
-        st.session_state.chatbot.df = df
-    
-    chatbot = st.session_state.chatbot
-    
-    # Quick action buttons
+    # All chatbot work goes through _chat_on, which binds this page's
+    # data snapshot and computes under one lock on the shared instance
+    df_key = _df_cache_key(df)
+
+    # Quick action buttons - one dict-driven dispatch instead of eight branches
     st.subheader("⚡ Quick Actions")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        if st.button("📊 Total Views", key="btn_views"):
-            result = chatbot.process_message("What is my total views?")
-            st.session_state.last_response = result['response']
-    
-    with col2:
-        if st.button("🏆 Top Videos", key="btn_top"):
-            result = chatbot.process_message("Show me my top 5 videos")
-            st.session_state.last_response = result['response']
-    
-    with col3:
-        if st.button("📅 Best Time to Post", key="btn_time"):
-            result = chatbot.process_message("When should I post?")
-            st.session_state.last_response = result['response']
-    
-    with col4:
-        if st.button("💡 Recommendations", key="btn_rec"):
-            result = chatbot.process_message("Give me recommendations for my channel")
-            st.session_state.last_response = result['response']
-    
-    # More quick actions
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        if st.button("📈 Growth Trend", key="btn_growth"):
-            result = chatbot.process_message("What is my growth trend?")
-            st.session_state.last_response = result['response']
-    
-    with col2:
-        if st.button("🎨 Best Content", key="btn_content"):
-            result = chatbot.process_message("What content works best?")
-            st.session_state.last_response = result['response']
-    
-    with col3:
-        if st.button("👥 Audience Info", key="btn_audience"):
-            result = chatbot.process_message("Tell me about my audience")
-            st.session_state.last_response = result['response']
-    
-    with col4:
-        if st.button("🏆 Benchmark", key="btn_benchmark"):
-            result = chatbot.process_message("Compare my performance to industry benchmarks")
-            st.session_state.last_response = result['response']
+
+    pending_prompt = None
+    for action_row in (QUICK_ACTIONS[:4], QUICK_ACTIONS[4:]):
+        cols = st.columns(4)
+        for col, (key, label, prompt) in zip(cols, action_row):
+            with col:
+                if st.button(label, key=key):
+                    pending_prompt = prompt
+
+    if pending_prompt:
+        result = _cached_chat(df_key, df, pending_prompt)
+        st.session_state.last_response = result['response']
     
     # Show last response
     if 'last_response' in st.session_state:
@@ -1284,7 +1457,7 @@ def render_chatbot(df):
     
     if user_input:
         with st.spinner("🤔 Thinking..."):
-            result = chatbot.process_message(user_input)
+            result = _chat_on(df_key, df, 'process_message', user_input)
             st.session_state.last_response = result['response']
             st.markdown(f"**Answer:** {result['response']}")
             
@@ -1310,7 +1483,9 @@ def render_chatbot(df):
         if st.button("📥 Generate Full Analytics Report", key="gen_pdf"):
             with st.spinner("Generating PDF report..."):
                 try:
-                    pdf_data = chatbot.generate_pdf_report()
+                    # Cached per data snapshot: repeat clicks skip the
+                    # fpdf/matplotlib rendering entirely
+                    pdf_data = _cached_pdf(df_key, df)
                     st.download_button(
                         label="📄 Download PDF Report",
                         data=pdf_data,
@@ -7,33 +7,69 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
-env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(env_path)
+env_path = Path(__file__).resolve().parent.parent / '.env'
 
+# Guard so re-imports under another module path (settings vs
+# config.settings) or reloads don't re-read and re-parse the file
+_DOTENV_LOADED = False
 
-class Settings:
-    """Application settings loaded from environment variables."""
-    
+
+def _load_dotenv_once():
+    """Load the .env file exactly once per process."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    load_dotenv(env_path, override=False)
+    _DOTENV_LOADED = True
+
+
+# Environment variable name -> (default, cast). Values resolve lazily on
+# first attribute access, so importing this module does no env/file work.
+_SPEC = {
     # YouTube API Configuration
-    YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY', '')
-    
+    'YOUTUBE_API_KEY': ('', str),
+
     # MySQL Database Configuration
-    DB_HOST = os.getenv('DB_HOST', 'localhost')
-    DB_PORT = int(os.getenv('DB_PORT', 3306))
-    DB_USER = os.getenv('DB_USER', 'root')
-    DB_PASSWORD = os.getenv('DB_PASSWORD', '')
-    DB_NAME = os.getenv('DB_NAME', 'youtube_analytics')
-    
+    'DB_HOST': ('localhost', str),
+    'DB_PORT': (3306, int),
+    'DB_USER': ('root', str),
+    'DB_PASSWORD': ('', str),
+    'DB_NAME': ('youtube_analytics', str),
+
     # OpenAI API (for chatbot)
-    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
-    
+    'OPENAI_API_KEY': ('', str),
+
     # Optional: Gemini API (alternative)
-    GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
-    
+    'GEMINI_API_KEY': ('', str),
+
     # Application Settings
-    MAX_VIDEOS = int(os.getenv('MAX_VIDEOS', 150))
-    DEFAULT_CHANNEL_ID = os.getenv('DEFAULT_CHANNEL_ID', '')
-    
+    'MAX_VIDEOS': (150, int),
+    'DEFAULT_CHANNEL_ID': ('', str),
+}
+
+
+class _LazySettings(type):
+    """Resolve settings from the environment on first use, then cache."""
+
+    def __getattr__(cls, name):
+        try:
+            default, cast = _SPEC[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        _load_dotenv_once()
+        value = cast(os.getenv(name, default))
+        # Cache on the class so later lookups bypass __getattr__ entirely
+        setattr(cls, name, value)
+        return value
+
+
+class Settings(metaclass=_LazySettings):
+    """Application settings loaded from environment variables."""
+
+    def __getattr__(self, name):
+        # Instance lookups defer to the lazy class attributes
+        return getattr(type(self), name)
+
     @classmethod
     def get_database_url(cls):
         """Get SQLAlchemy database URL."""
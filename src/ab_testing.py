@@ -8,134 +8,199 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import hashlib
+import threading
 import pandas as pd
 import numpy as np
 import re
 from typing import Dict, List, Tuple, Optional
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 try:
-    from PIL import Image, ImageStat, ImageFilter
+    from PIL import Image
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
 
+# Single source of truth for the literal keyword features: feature name
+# -> accepted substrings. The corpus masks and the single-title
+# alternation regex are both generated from this table, so the two code
+# paths cannot drift apart.
+_LITERALS = {
+    'howto': ('how to', 'how-to'),
+    'tips': ('tip',),
+    'secrets': ('secret',),
+    'guide': ('guide', 'tutorial'),
+    'versus': ('vs', 'versus'),
+    'list': ('list',),
+    'review': ('review',),
+    'myth': ('myth', 'false'),
+    'why': ('why',),
+    'best': ('best',),
+    'beginner': ('beginner', 'start'),
+    'advanced': ('advanced', 'pro'),
+}
+
+# Precompiled patterns shared by the corpus and single-title extractors.
+# The keyword alternation yields every literal flag in one scan of the
+# title instead of 14 separate substring searches.
+_NUM_RE = re.compile(r'\d')
+_WORD_RE = re.compile(r'\b\w{4,}\b')
+_KW_RE = re.compile('|'.join(
+    '(?P<%s>%s)' % (name, '|'.join(map(re.escape, alts)))
+    for name, alts in _LITERALS.items()
+))
+_KW_GROUPS = tuple(_KW_RE.groupindex)
+
 
 class ABTestSimulator:
     """Simulate A/B tests based on historical title patterns."""
-    
+
+    # Thumbnails are downsampled to this canvas before analysis; every
+    # metric is a summary statistic that survives moderate resizing
+    THUMB_ANALYSIS_SIZE = (256, 144)
+
+    # Bound on the per-simulator thumbnail analysis cache
+    THUMB_CACHE_SIZE = 64
+
     def __init__(self, df: pd.DataFrame):
-        """Initialize with video data."""
-        self.df = df.copy()
-    
+        """Initialize with video data. The frame is treated as read-only,
+        so it is held by reference rather than copied."""
+        self.df = df
+        # Pin the hot column once; every pattern aggregate reads it
+        self._views = (
+            df['views'].to_numpy(dtype=np.float64)
+            if 'views' in df.columns else np.zeros(len(df))
+        )
+        # LRU of analysis results keyed by content digest, so comparing
+        # many variants against the same image decodes it only once.
+        # The lock keeps it consistent when A and B analyze in parallel
+        self._thumb_cache: OrderedDict[bytes, Dict] = OrderedDict()
+        self._thumb_cache_lock = threading.Lock()
+        # Pattern masks are computed once per simulator with vectorized
+        # string ops, so repeated analyses skip per-row title scans
+        self._title_masks = self._build_title_masks()
+        # self.df never mutates for a simulator instance, so the derived
+        # feature frame and pattern analysis are computed at most once
+        self._features_df: Optional[pd.DataFrame] = None
+        self._patterns: Optional[Dict] = None
+
+    def _build_title_masks(self) -> Dict[str, np.ndarray]:
+        """Precompute one boolean mask per title pattern over the whole corpus."""
+        if self.df.empty or 'title' not in self.df.columns:
+            return {}
+
+        titles = self.df['title'].astype(str).str.lower()
+
+        masks = {'has_number': titles.str.contains(_NUM_RE).to_numpy()}
+        for name, alts in _LITERALS.items():
+            mask = titles.str.contains(alts[0], regex=False)
+            for alt in alts[1:]:
+                mask |= titles.str.contains(alt, regex=False)
+            masks['has_' + name] = mask.to_numpy()
+        masks['has_question'] = titles.str.contains('?', regex=False).to_numpy()
+
+        return masks
+
     def extract_title_features(self) -> pd.DataFrame:
         """Extract features from video titles."""
-        features = []
-        
-        for _, row in self.df.iterrows():
-            title = str(row.get('title', '')).lower()
-            
-            # Common patterns
-            has_number = bool(re.search(r'\d+', title))
-            has_howto = 'how to' in title or 'how-to' in title
-            has_tips = 'tip' in title or 'tips' in title
-            has_secrets = 'secret' in title or 'secrets' in title
-            has_guide = 'guide' in title or 'tutorial' in title
-            has_versus = 'vs' in title or 'versus' in title
-            has_list = 'list' in title
-            has_review = 'review' in title
-            has_myth = 'myth' in title or 'false' in title
-            has_why = 'why' in title
-            has_best = 'best' in title
-            has_beginner = 'beginner' in title or 'start' in title
-            has_advanced = 'advanced' in title or 'pro' in title
-            
-            # Question detection
-            has_question = '?' in title
-            
-            # Length
-            title_length = len(title)
-            word_count = len(title.split())
-            
-            features.append({
-                'video_id': row.get('video_id'),
-                'views': row.get('views', 0),
-                'ctr': row.get('ctr', 0),
-                'engagement_rate': row.get('engagement_rate', 0),
-                'has_number': has_number,
-                'has_howto': has_howto,
-                'has_tips': has_tips,
-                'has_secrets': has_secrets,
-                'has_guide': has_guide,
-                'has_versus': has_versus,
-                'has_list': has_list,
-                'has_review': has_review,
-                'has_myth': has_myth,
-                'has_why': has_why,
-                'has_best': has_best,
-                'has_beginner': has_beginner,
-                'has_advanced': has_advanced,
-                'has_question': has_question,
-                'title_length': title_length,
-                'word_count': word_count
-            })
-        
-        return pd.DataFrame(features)
+        if self._features_df is not None:
+            return self._features_df
+
+        if self.df.empty or 'title' not in self.df.columns:
+            return pd.DataFrame()
+
+        titles = self.df['title'].astype(str).str.lower()
+        n = len(self.df)
+
+        def col(name, default=0):
+            return self.df[name].to_numpy() if name in self.df.columns else np.full(n, default)
+
+        # Pattern flags come straight from the precomputed masks; only the
+        # length stats need fresh vectorized passes over the titles
+        data = {
+            'video_id': self.df['video_id'].to_numpy() if 'video_id' in self.df.columns else np.full(n, None),
+            'views': col('views'),
+            'ctr': col('ctr'),
+            'engagement_rate': col('engagement_rate'),
+        }
+        data.update(self._title_masks)
+        data['title_length'] = titles.str.len().to_numpy()
+        data['word_count'] = titles.str.split().str.len().to_numpy()
+
+        self._features_df = pd.DataFrame(data)
+        return self._features_df
     
     def analyze_title_patterns(self) -> Dict:
         """Analyze which title patterns perform best."""
-        features_df = self.extract_title_features()
-        
-        if features_df.empty:
+        if self._patterns is not None:
+            return self._patterns
+
+        if self.df.empty or not self._title_masks:
             return {'error': 'No data available'}
-        
+
         # Minimum sample size for reliable analysis
         min_sample_size = 3
-        
+
+        views = self._views
+
+        # The grand total is shared by every feature, so each mask costs
+        # one masked sum; the complement average falls out by subtraction
+        total_views = views.sum()
+        total_count = len(views)
+
+        # Gather per-feature counts and sums, skipping thin samples
+        names = []
+        counts_with = []
+        sums_with = []
+        for feature, mask in self._title_masks.items():
+            n_with = int(mask.sum())
+            if n_with >= min_sample_size and total_count - n_with >= min_sample_size:
+                names.append(feature.replace('has_', ''))
+                counts_with.append(n_with)
+                sums_with.append(views[mask].sum())
+
+        if not names:
+            self._patterns = {}
+            return self._patterns
+
+        counts_with = np.array(counts_with, dtype=np.int64)
+        sums_with = np.array(sums_with)
+        counts_without = total_count - counts_with
+        avg_with = sums_with / counts_with
+        avg_without = (total_views - sums_with) / counts_without
+
+        # One clip over the whole improvement vector caps every feature
+        # to realistic bounds (max ±30%) without per-pattern scalar math
+        safe_without = np.where(avg_without > 0, avg_without, 1.0)
+        improvements = np.clip((avg_with - avg_without) / safe_without * 100, -30, 30).round(2)
+
+        # Calculate confidence based on sample size
+        if total_count >= 20:
+            confidence = "High"
+        elif total_count >= 10:
+            confidence = "Medium"
+        else:
+            confidence = "Low"
+
         patterns = {}
-        
-        # Analyze each feature
-        feature_cols = ['has_number', 'has_howto', 'has_tips', 'has_secrets', 
-                       'has_guide', 'has_versus', 'has_list', 'has_review',
-                       'has_myth', 'has_why', 'has_best', 'has_beginner', 
-                       'has_advanced', 'has_question']
-        
-        for feature in feature_cols:
-            if feature in features_df.columns:
-                with_feature = features_df[features_df[feature] == True]
-                without_feature = features_df[features_df[feature] == False]
-                
-                # Only analyze if we have enough samples
-                if len(with_feature) >= min_sample_size and len(without_feature) >= min_sample_size:
-                    avg_views_with = with_feature['views'].mean()
-                    avg_views_without = without_feature['views'].mean()
-                    
-                    if avg_views_without > 0:
-                        improvement = ((avg_views_with - avg_views_without) / avg_views_without) * 100
-                        
-                        # Cap improvement to realistic bounds (max ±30%)
-                        improvement = max(-30, min(30, improvement))
-                        
-                        # Calculate confidence based on sample size
-                        total_samples = len(with_feature) + len(without_feature)
-                        if total_samples >= 20:
-                            confidence = "High"
-                        elif total_samples >= 10:
-                            confidence = "Medium"
-                        else:
-                            confidence = "Low"
-                        
-                        patterns[feature.replace('has_', '')] = {
-                            'avg_views_with': int(avg_views_with),
-                            'avg_views_without': int(avg_views_without),
-                            'improvement_percentage': round(improvement, 2),
-                            'sample_size_with': len(with_feature),
-                            'sample_size_without': len(without_feature),
-                            'confidence': confidence,
-                            'recommendation': 'Use this pattern' if improvement > 0 else 'Avoid this pattern'
-                        }
-        
+        for i, name in enumerate(names):
+            if avg_without[i] <= 0:
+                continue
+            improvement = float(improvements[i])
+            patterns[name] = {
+                'avg_views_with': int(avg_with[i]),
+                'avg_views_without': int(avg_without[i]),
+                'improvement_percentage': improvement,
+                'sample_size_with': int(counts_with[i]),
+                'sample_size_without': int(counts_without[i]),
+                'confidence': confidence,
+                'recommendation': 'Use this pattern' if improvement > 0 else 'Avoid this pattern'
+            }
+
+        self._patterns = patterns
         return patterns
     
     def simulate_title_change(self, current_title: str, new_title: str) -> Dict:
@@ -178,11 +243,8 @@ class ABTestSimulator:
         if improvements:
             # Apply damping to avoid unrealistic projections
             # Raw average can be too optimistic, so we use geometric mean approach
-            raw_change = float(np.mean(improvements))
-            # Dampen by 50% to be more conservative
-            expected_change = raw_change * 0.5
-            # Cap at ±25%
-            expected_change = max(-25, min(25, expected_change))
+            # Dampen by 50% to be more conservative, cap at ±25%
+            expected_change = float(np.clip(np.mean(improvements) * 0.5, -25, 25))
         else:
             expected_change = 0.0
         
@@ -213,23 +275,15 @@ class ABTestSimulator:
     def _extract_single_title_features(self, title: str) -> Dict:
         """Extract features from a single title."""
         title = title.lower()
-        
-        return {
-            'number': bool(re.search(r'\d+', title)),
-            'howto': 'how to' in title or 'how-to' in title,
-            'tips': 'tip' in title or 'tips' in title,
-            'secrets': 'secret' in title or 'secrets' in title,
-            'guide': 'guide' in title or 'tutorial' in title,
-            'versus': 'vs' in title or 'versus' in title,
-            'list': 'list' in title,
-            'review': 'review' in title,
-            'myth': 'myth' in title or 'false' in title,
-            'why': 'why' in title,
-            'best': 'best' in title,
-            'beginner': 'beginner' in title or 'start' in title,
-            'advanced': 'advanced' in title or 'pro' in title,
-            'question': '?' in title
-        }
+
+        # One alternation pass flips every keyword flag it encounters
+        features = {'number': _NUM_RE.search(title) is not None}
+        features.update(dict.fromkeys(_KW_GROUPS, False))
+        for match in _KW_RE.finditer(title):
+            features[match.lastgroup] = True
+        features['question'] = '?' in title
+
+        return features
     
     def _calculate_confidence(self, improvements: List[float], pattern_details: List[Dict] = None) -> str:
         """Calculate confidence level based on sample size and variance."""
@@ -268,57 +322,61 @@ class ABTestSimulator:
         if self.df.empty:
             return []
         
-        # Analyze keywords
-        keyword_stats = defaultdict(lambda: {'views': [], 'count': 0})
-        
-        for _, row in self.df.iterrows():
-            title = str(row.get('title', '')).lower()
-            words = re.findall(r'\b\w+\b', title)
-            
-            for word in words:
-                if len(word) > 3:  # Only meaningful words
-                    keyword_stats[word]['views'].append(row.get('views', 0))
-                    keyword_stats[word]['count'] += 1
-        
-        # Calculate average views per keyword
-        keyword_performance = []
-        for keyword, stats in keyword_stats.items():
-            if stats['count'] >= 3:  # Minimum sample size
-                keyword_performance.append({
-                    'keyword': keyword,
-                    'avg_views': int(np.mean(stats['views'])),
-                    'total_videos': stats['count']
-                })
-        
-        # Sort by average views
-        keyword_performance.sort(key=lambda x: x['avg_views'], reverse=True)
-        
-        return keyword_performance[:n]
+        # Explode each title into its meaningful (4+ letter) words, then
+        # aggregate views per word in one groupby instead of a Python loop
+        exploded = pd.DataFrame({
+            'keyword': self.df['title'].astype(str).str.lower().str.findall(_WORD_RE),
+            'views': self.df['views'] if 'views' in self.df.columns else 0,
+        }).explode('keyword').dropna(subset=['keyword'])
+
+        stats = exploded.groupby('keyword')['views'].agg(['mean', 'count'])
+        stats = stats[stats['count'] >= 3]  # Minimum sample size
+        stats = stats.nlargest(n, 'mean')  # Partial selection beats a full sort
+
+        return [
+            {
+                'keyword': keyword,
+                'avg_views': int(row['mean']),
+                'total_videos': int(row['count'])
+            }
+            for keyword, row in stats.iterrows()
+        ]
     
     def get_title_length_analysis(self) -> Dict:
         """Analyze optimal title length."""
         features_df = self.extract_title_features()
-        
+
         if features_df.empty:
             return {'error': 'No data available'}
-        
+
         # Define length buckets
-        features_df['length_bucket'] = pd.cut(
-            features_df['title_length'],
-            bins=[0, 40, 60, 80, 100, 200],
-            labels=['Very Short', 'Short', 'Medium', 'Long', 'Very Long']
-        )
-        
-        by_length = features_df.groupby('length_bucket').agg({
-            'views': 'mean',
-            'ctr': 'mean',
-            'video_id': 'count'
-        }).rename(columns={'video_id': 'count'})
-        
-        best_length = by_length['views'].idxmax()
-        
+        bins = np.array([0, 40, 60, 80, 100, 200])
+        labels = ['Very Short', 'Short', 'Medium', 'Long', 'Very Long']
+
+        lengths = features_df['title_length'].to_numpy()
+        views = features_df['views'].to_numpy(dtype=np.float64)
+        ctr = features_df['ctr'].to_numpy(dtype=np.float64)
+
+        # Bucket with digitize + bincount: one pass per statistic and no
+        # Categorical/groupby machinery (which also mutated the cached
+        # feature frame)
+        idx = np.digitize(lengths, bins, right=True) - 1
+        valid = (idx >= 0) & (idx < len(labels))
+        idx = idx[valid]
+
+        counts = np.bincount(idx, minlength=len(labels))
+        divisor = np.maximum(counts, 1)
+        mean_views = np.where(counts > 0, np.bincount(idx, weights=views[valid], minlength=len(labels)) / divisor, np.nan)
+        mean_ctr = np.where(counts > 0, np.bincount(idx, weights=ctr[valid], minlength=len(labels)) / divisor, np.nan)
+
+        best_length = labels[int(np.argmax(np.nan_to_num(mean_views, nan=-1.0)))]
+
         return {
-            'analysis': by_length.to_dict(),
+            'analysis': {
+                'views': dict(zip(labels, mean_views)),
+                'ctr': dict(zip(labels, mean_ctr)),
+                'count': dict(zip(labels, counts)),
+            },
             'optimal_length': best_length,
             'recommendation': f"Titles around {best_length} perform best"
         }
@@ -335,66 +393,95 @@ class ABTestSimulator:
                 'face_like_features': False,
                 'composition_score': 0
             }
-        
+
+        # blake2b-128 is cheap relative to a decode and collision-safe
+        # enough to key identical uploads
+        cache_key = hashlib.blake2b(image_data, digest_size=16).digest()
+        with self._thumb_cache_lock:
+            cached = self._thumb_cache.get(cache_key)
+            if cached is not None:
+                self._thumb_cache.move_to_end(cache_key)
+                return cached
+
         try:
             img = Image.open(BytesIO(image_data))
             
             # Convert to RGB if necessary
             if img.mode != 'RGB':
                 img = img.convert('RGB')
-            
-            # Get image stats
-            stat = ImageStat.Stat(img)
-            
+
+            # Shrink before any stats: ~25x fewer pixels for a 720p source
+            # with no meaningful change to the summary metrics. The
+            # original size is kept for aspect-ratio reporting below.
+            img_small = img.resize(self.THUMB_ANALYSIS_SIZE, Image.BILINEAR)
+
+            # One contiguous uint8 array; every statistic below reads it
+            # instead of making separate ImageStat passes
+            arr = np.asarray(img_small, dtype=np.uint8)
+            channels = arr.reshape(-1, 3).astype(np.float64)
+            channel_means = channels.mean(axis=0)
+            channel_vars = channels.var(axis=0)
+
             # Calculate brightness (0-255)
-            brightness = sum(stat.mean) / 3
-            
+            brightness = channel_means.mean()
+
             # Calculate contrast
-            r_std, g_std, b_std = stat.stddev
-            contrast = (r_std + g_std + b_std) / 3
-            
+            contrast = np.sqrt(channel_vars).mean()
+
             # Calculate colorfulness
-            r_mean, g_mean, b_mean = stat.mean
+            r_mean, g_mean, b_mean = channel_means
             colorfulness = abs(r_mean - g_mean) + abs(g_mean - b_mean) + abs(b_mean - r_mean)
-            
-            # Detect edges (indicator of text/sharp features)
-            edges = img.filter(ImageFilter.FIND_EDGES)
-            edge_stat = ImageStat.Stat(edges)
-            edge_intensity = sum(edge_stat.mean) / 3
-            
-            # Simple face detection proxy: look for skin-tone colored regions
-            # This is a simplified heuristic
-            pixels = list(img.getdata())
-            skin_tone_pixels = 0
-            for r, g, b in pixels:
-                # Simple skin tone detection
-                if (r > 60 and g > 40 and b > 20 and 
-                    r > g and r > b and 
-                    abs(r - g) > 15 and abs(r - b) > 15):
-                    skin_tone_pixels += 1
-            
-            skin_ratio = skin_tone_pixels / len(pixels) if pixels else 0
+
+            # Detect edges (indicator of text/sharp features): summed
+            # mean gradient magnitude of the full-resolution grayscale.
+            # Full size matters here — downsampling averages away the
+            # high-frequency detail text produces — and the x+y sum
+            # approximates the FIND_EDGES response scale, keeping the
+            # classification boundary below compatible
+            gray = np.asarray(img.convert('L'), dtype=np.int16)
+            dx = np.abs(np.diff(gray, axis=1))
+            dy = np.abs(np.diff(gray, axis=0))
+            edge_intensity = dx.mean() + dy.mean()
+
+            # Simple face detection proxy: look for skin-tone colored regions.
+            # Boolean array algebra replaces the old per-pixel Python loop
+            r = arr[..., 0].astype(np.int16)
+            g = arr[..., 1].astype(np.int16)
+            b = arr[..., 2].astype(np.int16)
+            skin_mask = (
+                (r > 60) & (g > 40) & (b > 20)
+                & (r > g) & (r > b)
+                & (np.abs(r - g) > 15) & (np.abs(r - b) > 15)
+            )
+            skin_ratio = float(skin_mask.mean()) if skin_mask.size else 0
             has_face_like = skin_ratio > 0.05 and skin_ratio < 0.6
-            
+
             # Text-like features (high edge density in certain regions)
-            has_text_like = edge_intensity > 20
-            
+            has_text_like = bool(edge_intensity > 20)
+
             # Composition score based on brightness distribution
-            brightness_variance = stat.var[0] + stat.var[1] + stat.var[2]
+            brightness_variance = channel_vars.sum()
             composition_score = min(100, brightness_variance / 1000)
             
-            return {
-                'brightness': round(brightness, 2),
-                'contrast': round(contrast, 2),
-                'colorfulness': round(colorfulness, 2),
-                'edge_intensity': round(edge_intensity, 2),
+            result = {
+                'brightness': round(float(brightness), 2),
+                'contrast': round(float(contrast), 2),
+                'colorfulness': round(float(colorfulness), 2),
+                'edge_intensity': round(float(edge_intensity), 2),
                 'has_face_like_features': has_face_like,
                 'has_text_like_features': has_text_like,
-                'composition_score': round(composition_score, 2),
+                'composition_score': round(float(composition_score), 2),
                 'size': img.size,
                 'aspect_ratio': round(img.size[0] / img.size[1], 2) if img.size[1] > 0 else 0
             }
-            
+
+            with self._thumb_cache_lock:
+                self._thumb_cache[cache_key] = result
+                if len(self._thumb_cache) > self.THUMB_CACHE_SIZE:
+                    self._thumb_cache.popitem(last=False)
+
+            return result
+
         except Exception as e:
             return {
                 'error': f'Failed to analyze image: {str(e)}',
@@ -408,8 +495,13 @@ class ABTestSimulator:
     
     def compare_thumbnails(self, thumb_a_data: bytes, thumb_b_data: bytes) -> Dict:
         """Compare two thumbnails and provide recommendations."""
-        analysis_a = self.analyze_thumbnail(thumb_a_data)
-        analysis_b = self.analyze_thumbnail(thumb_b_data)
+        # Decode and analyze both images in parallel; PIL's decoders and
+        # the numpy statistics both release the GIL
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_a = executor.submit(self.analyze_thumbnail, thumb_a_data)
+            future_b = executor.submit(self.analyze_thumbnail, thumb_b_data)
+            analysis_a = future_a.result()
+            analysis_b = future_b.result()
         
         if 'error' in analysis_a or 'error' in analysis_b:
             return {
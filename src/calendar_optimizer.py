@@ -5,32 +5,216 @@ Recommends optimal posting schedule for maximum views and subscriber growth.
 import sys
 import os
 import re
+import types
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import functools
+
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+DAY_TO_IDX = {day: i for i, day in enumerate(DAY_ORDER)}
+
+# All 24 AM/PM labels precomputed once at import; formatting becomes a
+# plain tuple index
+HOUR_AMPM = tuple(
+    "12:00 AM (Midnight)" if h == 0
+    else "12:00 PM (Noon)" if h == 12
+    else f"{h}:00 AM" if h < 12
+    else f"{h - 12}:00 PM"
+    for h in range(24)
+)
+
+# Per-day content suggestions are static, so they live in one read-only
+# module table instead of being rebuilt per calendar entry
+_CONTENT_TYPES = types.MappingProxyType({
+    'Monday': {
+        'type': 'Educational',
+        'description': 'Start the week with value - teach something useful',
+        'reason': 'Audiences are in work mode and looking to learn',
+        'example': 'How-to videos, tutorials, educational content'
+    },
+    'Tuesday': {
+        'type': 'Tutorial',
+        'description': 'Step-by-step guides and how-tos',
+        'reason': 'Tutorials perform well early in the week',
+        'example': 'Complete guides, step-by-step tutorials'
+    },
+    'Wednesday': {
+        'type': 'List',
+        'description': 'Top lists, rankings, or compilations',
+        'reason': 'Mid-week engagement peaks with list content',
+        'example': 'Top 10, rankings, best of lists'
+    },
+    'Thursday': {
+        'type': 'Reaction',
+        'description': 'React to trends, share opinions',
+        'reason': 'Builds anticipation for the weekend',
+        'example': 'React to news, trending topics, opinions'
+    },
+    'Friday': {
+        'type': 'Behind the Scenes',
+        'description': 'Vlogs, BTS, personal content',
+        'reason': 'Weekend vibes start, more casual content works',
+        'example': 'Day in life, vlogs, behind the scenes'
+    },
+    'Saturday': {
+        'type': 'Entertainment',
+        'description': 'Fun content, challenges, lifestyle',
+        'reason': 'Highest engagement - people have free time',
+        'example': 'Challenges, lifestyle, fun content'
+    },
+    'Sunday': {
+        'type': 'Q&A',
+        'description': 'Answer fan questions, community content',
+        'reason': 'End of week - connect with your audience',
+        'example': 'Q&A, community requests, fan interactions'
+    }
+})
+
+_DEFAULT_CONTENT = types.MappingProxyType({
+    'type': 'Regular',
+    'description': 'Standard content',
+    'reason': 'Consistent uploading builds audience habits',
+    'example': 'Regular uploads'
+})
+
+# Every keyword pattern in one compiled alternation; a single scan per
+# title yields all of them together
+_PATTERN_RE = re.compile(
+    r'(?P<how_to>how[- ]to)|(?P<top_list>top|ranking)|(?P<best>best)|'
+    r'(?P<review>review)|(?P<tutorial>tutorial|guide)|(?P<vs> vs |versus)|'
+    r'(?P<secret>secret)|(?P<why>why)|(?P<numbers>\d)',
+    re.IGNORECASE
+)
+
+
+class _LazyStats:
+    """Dict-like view over an aggregate frame.
+
+    The nested-dict form (``to_dict()``) is only built on first access,
+    so consumers that just read the best-day/best-hour fields never pay
+    for it.
+    """
+    __slots__ = ('_df', '_dict')
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+        self._dict = None
+
+    def _data(self) -> Dict:
+        if self._dict is None:
+            self._dict = self._df.to_dict()
+        return self._dict
+
+    def __getitem__(self, key):
+        return self._data()[key]
+
+    def get(self, key, default=None):
+        return self._data().get(key, default)
+
+    def keys(self):
+        return self._data().keys()
+
+    def items(self):
+        return self._data().items()
+
+    def __iter__(self):
+        return iter(self._data())
+
+    def __len__(self) -> int:
+        return len(self._df.columns)
+
+    def __bool__(self) -> bool:
+        return not self._df.empty
+
+    def __contains__(self, key) -> bool:
+        return key in self._df.columns
+
+
+def _top_k_indices(arr: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest finite values, in descending order.
+
+    NaN entries never qualify. argpartition keeps the selection O(n)
+    instead of nlargest's heap pass.
+    """
+    arr = np.where(np.isnan(arr), -np.inf, arr)
+    k = min(k, int(np.count_nonzero(arr > -np.inf)))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(arr):
+        idx = np.argpartition(-arr, k - 1)[:k]
+    else:
+        idx = np.arange(len(arr))
+    return idx[np.argsort(-arr[idx], kind='stable')]
+
+
+def _memoized(method):
+    """Cache a no-argument analysis on the instance; the frame never
+    changes after construction, so each analysis runs at most once."""
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = self._cache
+        if method.__name__ not in cache:
+            cache[method.__name__] = method(self)
+        return cache[method.__name__]
+    return wrapper
+
 
 class CalendarOptimizer:
     """Optimize content calendar based on historical performance."""
     
     def __init__(self, df: pd.DataFrame, timezone: str = 'UTC'):
         """Initialize with video data and timezone."""
-        self.df = df.copy()
+        # Shallow copy: copy-on-write shares the caller's column arrays
+        # while keeping the derived-column writes below from leaking back
+        self.df = df.copy(deep=False)
         self.timezone = timezone
+        # Parse the timestamp column once; every analysis below is then a
+        # pure groupby with no repeated string parsing (cache=True
+        # deduplicates identical timestamps during the parse)
+        if 'published_at' in self.df.columns and not self.df.empty:
+            self.df['published_at'] = pd.to_datetime(
+                self.df['published_at'], errors='coerce', cache=True
+            )
+            # Drop rows whose timestamp failed to parse before the
+            # derivations below: the small-int casts cannot hold NaT
+            parsed = self.df['published_at'].notna()
+            if not parsed.all():
+                self.df = self.df.loc[parsed]
+            dt = self.df['published_at'].dt
+            if 'day_of_week' not in self.df.columns:
+                self.df['day_of_week'] = dt.day_name()
+            # Ordered categorical keys let the weekday groupby hash int8
+            # codes instead of Python strings, already in Monday-first order
+            self.df['day_of_week'] = pd.Categorical(
+                self.df['day_of_week'], categories=DAY_ORDER, ordered=True
+            )
+            if 'hour' not in self.df.columns:
+                self.df['hour'] = dt.hour
+            # Tiny-int dtypes: hour/month fit int8, shrinking the arrays
+            # every aggregation has to stream through
+            self.df['hour'] = self.df['hour'].astype('int8')
+            self.df['week'] = dt.isocalendar().week.astype('int16')
+            self.df['month'] = dt.month.astype('int8')
+        if 'title' in self.df.columns and not self.df.empty:
+            self.df['title_len'] = self.df['title'].astype(str).str.len().astype('int32')
+        self._cache = {}
+        self._by_day = None
         self._detect_timezone()
-    
+
     def _detect_timezone(self):
         """Detect timezone from data or use default."""
         # Try to get timezone from published_at if available
         if 'published_at' in self.df.columns and len(self.df) > 0:
             try:
                 # Check if timezone info exists in the data
-                sample_dt = pd.to_datetime(self.df['published_at'].iloc[0])
+                sample_dt = self.df['published_at'].iloc[0]
                 if sample_dt.tzinfo is not None:
                     self.timezone = str(sample_dt.tzinfo)
                 else:
@@ -59,70 +243,123 @@ class CalendarOptimizer:
         }
         return timezone_map.get(self.timezone, f'{self.timezone} (Local Time)')
     
+    @_memoized
+    def _time_marginals(self):
+        """Fused (day, hour, month) aggregation in one pass over the data.
+
+        Flattens the three small integer keys into one bincount key, so
+        the day, hour and seasonal analyses all marginalize the same
+        7x24x12 tensors instead of each running its own groupby scan.
+        Returns (counts, sums) or None when the date columns are missing.
+        """
+        if not {'day_of_week', 'hour', 'month'}.issubset(self.df.columns):
+            return None
+
+        dow = self.df['day_of_week'].cat.codes.to_numpy()
+        valid = dow >= 0  # drop rows whose timestamp failed to parse
+        dow = dow[valid].astype(np.int64)
+        hr = self.df['hour'].to_numpy()[valid].astype(np.int64)
+        mo = self.df['month'].to_numpy()[valid].astype(np.int64) - 1
+        flat = (dow * 24 + hr) * 12 + mo
+
+        size = 7 * 24 * 12
+        counts = np.bincount(flat, minlength=size).reshape(7, 24, 12)
+        sums = {}
+        for col in ('views', 'engagement_rate', 'likes', 'comments'):
+            if col in self.df.columns:
+                weights = self.df[col].to_numpy(dtype=np.float64)[valid]
+                sums[col] = np.bincount(
+                    flat, weights=weights, minlength=size
+                ).reshape(7, 24, 12)
+        return counts, sums
+
+    @_memoized
     def analyze_best_days(self) -> Dict:
         """Analyze best days of the week for posting."""
         if self.df.empty:
             return {'error': 'No data available'}
-        
-        # Add day_of_week if not present
-        if 'day_of_week' not in self.df.columns:
-            if 'published_at' in self.df.columns:
-                self.df['day_of_week'] = pd.to_datetime(self.df['published_at']).dt.day_name()
-            else:
-                return {'error': 'No date data available to analyze days'}
-        
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
-        # Calculate average metrics by day
-        by_day = self.df.groupby('day_of_week').agg({
-            'views': ['mean', 'sum', 'count'],
-            'engagement_rate': 'mean',
-            'likes': 'mean',
-            'comments': 'mean'
-        })
-        
-        by_day.columns = ['avg_views', 'total_views', 'video_count', 'avg_engagement', 'avg_likes', 'avg_comments']
-        by_day = by_day.reindex(day_order)
-        
-        # Find best days
-        best_day_views = by_day['avg_views'].idxmax()
-        best_day_engagement = by_day['avg_engagement'].idxmax()
-        
+
+        # day_of_week is derived once at construction
+        marginals = self._time_marginals()
+        if marginals is None:
+            return {'error': 'No date data available to analyze days'}
+
+        # Marginalize the fused tensor over (hour, month); all seven days
+        # stay present, Monday-first, with NaN means for empty days
+        counts, sums = marginals
+        n = counts.sum(axis=(1, 2))
+        safe = np.maximum(n, 1)
+        views_sum = sums['views'].sum(axis=(1, 2))
+
+        def day_mean(col):
+            return np.where(n > 0, sums[col].sum(axis=(1, 2)) / safe, np.nan)
+
+        by_day = pd.DataFrame({
+            'avg_views': np.where(n > 0, views_sum / safe, np.nan),
+            # Totals stay 64-bit like the old groupby sums; the per-video
+            # dtype may be a downcast uint32 that day totals can overflow
+            'total_views': views_sum.astype(np.int64),
+            'video_count': n,
+            'avg_engagement': day_mean('engagement_rate'),
+            'avg_likes': day_mean('likes'),
+            'avg_comments': day_mean('comments'),
+        }, index=pd.CategoricalIndex(
+            DAY_ORDER, categories=DAY_ORDER, ordered=True, name='day_of_week'
+        ))
+
+        # Find best days (nanargmax skips empty days without the pandas
+        # label-resolution overhead of idxmax)
+        best_day_views = by_day.index[np.nanargmax(by_day['avg_views'].to_numpy())]
+        best_day_engagement = by_day.index[np.nanargmax(by_day['avg_engagement'].to_numpy())]
+
+        # Keep the frame itself for internal consumers (calendar
+        # generation), sparing them a dict -> DataFrame round trip
+        self._by_day = by_day
+
         return {
-            'daily_stats': by_day.to_dict(),
+            'daily_stats': _LazyStats(by_day),
             'best_day_for_views': best_day_views,
             'best_day_for_engagement': best_day_engagement,
             'recommendation': self._get_day_recommendation(by_day)
         }
     
+    @_memoized
     def analyze_best_hours(self) -> Dict:
         """Analyze best hours for posting with timezone awareness."""
         if self.df.empty:
             return {'error': 'No data available'}
         
-        # Add hour if not present
-        if 'hour' not in self.df.columns:
-            if 'published_at' in self.df.columns:
-                self.df['hour'] = pd.to_datetime(self.df['published_at']).dt.hour
-            else:
-                return {'error': 'No time data available to analyze hours'}
-        
-        by_hour = self.df.groupby('hour').agg({
-            'views': ['mean', 'sum', 'count'],
-            'engagement_rate': 'mean'
-        })
-        
-        by_hour.columns = ['avg_views', 'total_views', 'video_count', 'avg_engagement']
+        # hour is derived once at construction
+        marginals = self._time_marginals()
+        if marginals is None:
+            return {'error': 'No time data available to analyze hours'}
+
+        # Marginalize the fused tensor over (day, month), keeping only
+        # hours that actually occur (matching the old groupby output)
+        counts, sums = marginals
+        n = counts.sum(axis=(0, 2))
+        active = n > 0
+        n = n[active]
+        views_sum = sums['views'].sum(axis=(0, 2))[active]
+        eng_sum = sums['engagement_rate'].sum(axis=(0, 2))[active]
+
+        by_hour = pd.DataFrame({
+            'avg_views': views_sum / n,
+            'total_views': views_sum.astype(np.int64),
+            'video_count': n,
+            'avg_engagement': eng_sum / n,
+        }, index=pd.Index(np.arange(24)[active], name='hour'))
         
         # Find best hours
-        best_hour_views = by_hour['avg_views'].idxmax()
-        best_hour_engagement = by_hour['avg_engagement'].idxmax()
+        best_hour_views = by_hour.index[np.nanargmax(by_hour['avg_views'].to_numpy())]
+        best_hour_engagement = by_hour.index[np.nanargmax(by_hour['avg_engagement'].to_numpy())]
         
         # Get top 3 hours
-        top_hours = by_hour.nlargest(3, 'avg_views').index.tolist()
+        idx = _top_k_indices(by_hour['avg_views'].to_numpy(), 3)
+        top_hours = by_hour.index.to_numpy()[idx].tolist()
         
         return {
-            'hourly_stats': by_hour.to_dict(),
+            'hourly_stats': _LazyStats(by_hour),
             'best_hour_for_views': best_hour_views,
             'best_hour_for_engagement': best_hour_engagement,
             'top_3_hours': top_hours,
@@ -133,14 +370,7 @@ class CalendarOptimizer:
     
     def _format_hour_ampm(self, hour: int) -> str:
         """Convert hour to AM/PM format with context."""
-        if hour == 0:
-            return "12:00 AM (Midnight)"
-        elif hour == 12:
-            return "12:00 PM (Noon)"
-        elif hour < 12:
-            return f"{hour}:00 AM"
-        else:
-            return f"{hour-12}:00 PM"
+        return HOUR_AMPM[hour]
     
     def _get_hour_recommendation(self, best_hour: int, top_hours: List[int]) -> str:
         """Get hour recommendation with AM/PM format and timezone."""
@@ -152,7 +382,7 @@ class CalendarOptimizer:
     
     def _get_day_recommendation(self, by_day: pd.DataFrame) -> str:
         """Get day recommendation based on analysis."""
-        best_day = by_day['avg_views'].idxmax()
+        best_day = by_day.index[np.nanargmax(by_day['avg_views'].to_numpy())]
         weekend_avg = by_day.loc[['Saturday', 'Sunday'], 'avg_views'].mean()
         weekday_avg = by_day.loc[['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'], 'avg_views'].mean()
         
@@ -172,15 +402,16 @@ class CalendarOptimizer:
         else:
             return "Consider increasing upload frequency for better growth."
     
+    @_memoized
     def _get_best_title_patterns(self) -> Dict:
         """Analyze title patterns from top-performing videos."""
         if self.df.empty or 'title' not in self.df.columns:
             return {'error': 'Title data not available'}
         
-        # Get top 20% performers
-        threshold = self.df['views'].quantile(0.80)
-        top_videos = self.df[self.df['views'] >= threshold]
-        
+        # Get top 20% performers; nlargest partial-sorts instead of the
+        # full sort a quantile threshold plus boolean mask would cost
+        top_videos = self.df.nlargest(max(3, len(self.df) // 5), 'views')
+
         if len(top_videos) < 3:
             # Not enough data, return defaults
             return {
@@ -190,48 +421,20 @@ class CalendarOptimizer:
                 'use_questions': True
             }
         
-        # Analyze patterns
-        patterns_found = {
-            'how_to': 0,
-            'top_list': 0,
-            'best': 0,
-            'review': 0,
-            'tutorial': 0,
-            'vs': 0,
-            'secret': 0,
-            'why': 0,
-            'numbers': 0,
-            'questions': 0
-        }
-        
-        for title in top_videos['title']:
-            title_lower = str(title).lower()
-            if 'how to' in title_lower or 'how-to' in title_lower:
-                patterns_found['how_to'] += 1
-            if 'top' in title_lower or 'ranking' in title_lower:
-                patterns_found['top_list'] += 1
-            if 'best' in title_lower:
-                patterns_found['best'] += 1
-            if 'review' in title_lower:
-                patterns_found['review'] += 1
-            if 'tutorial' in title_lower or 'guide' in title_lower:
-                patterns_found['tutorial'] += 1
-            if ' vs ' in title_lower or 'versus' in title_lower:
-                patterns_found['vs'] += 1
-            if 'secret' in title_lower:
-                patterns_found['secret'] += 1
-            if 'why' in title_lower:
-                patterns_found['why'] += 1
-            if re.search(r'\d+', title_lower):
-                patterns_found['numbers'] += 1
-            if '?' in title:
-                patterns_found['questions'] += 1
-        
+        # Analyze patterns: one alternation scan per title tallies every
+        # keyword; a title counts once per pattern regardless of repeats
+        titles = top_videos['title'].astype(str)
+        matches = titles.str.extractall(_PATTERN_RE)
+        hits = matches.notna().groupby(level=0).any().sum() if not matches.empty else {}
+
+        patterns_found = {name: int(hits.get(name, 0)) for name in _PATTERN_RE.groupindex}
+        patterns_found['questions'] = int(titles.str.contains('?', regex=False).sum())
+
         # Get most common patterns
         best_patterns = sorted(patterns_found.items(), key=lambda x: x[1], reverse=True)[:5]
         best_patterns = [p[0].replace('_', ' ').title() for p in best_patterns if p[1] > 0]
-        
-        avg_length = int(top_videos['title'].str.len().mean())
+
+        avg_length = int(top_videos['title_len'].mean())
         
         return {
             'best_patterns': best_patterns if best_patterns else ['How to', 'Top', 'Best'],
@@ -286,57 +489,7 @@ class CalendarOptimizer:
     
     def _suggest_content_type(self, day: str, day_idx: int) -> Dict:
         """Suggest content type based on day with detailed info."""
-        content_types = {
-            'Monday': {
-                'type': 'Educational',
-                'description': 'Start the week with value - teach something useful',
-                'reason': 'Audiences are in work mode and looking to learn',
-                'example': 'How-to videos, tutorials, educational content'
-            },
-            'Tuesday': {
-                'type': 'Tutorial',
-                'description': 'Step-by-step guides and how-tos',
-                'reason': 'Tutorials perform well early in the week',
-                'example': 'Complete guides, step-by-step tutorials'
-            },
-            'Wednesday': {
-                'type': 'List',
-                'description': 'Top lists, rankings, or compilations',
-                'reason': 'Mid-week engagement peaks with list content',
-                'example': 'Top 10, rankings, best of lists'
-            },
-            'Thursday': {
-                'type': 'Reaction',
-                'description': 'React to trends, share opinions',
-                'reason': 'Builds anticipation for the weekend',
-                'example': 'React to news, trending topics, opinions'
-            },
-            'Friday': {
-                'type': 'Behind the Scenes',
-                'description': 'Vlogs, BTS, personal content',
-                'reason': 'Weekend vibes start, more casual content works',
-                'example': 'Day in life, vlogs, behind the scenes'
-            },
-            'Saturday': {
-                'type': 'Entertainment',
-                'description': 'Fun content, challenges, lifestyle',
-                'reason': 'Highest engagement - people have free time',
-                'example': 'Challenges, lifestyle, fun content'
-            },
-            'Sunday': {
-                'type': 'Q&A',
-                'description': 'Answer fan questions, community content',
-                'reason': 'End of week - connect with your audience',
-                'example': 'Q&A, community requests, fan interactions'
-            }
-        }
-        
-        return content_types.get(day, {
-            'type': 'Regular',
-            'description': 'Standard content',
-            'reason': 'Consistent uploading builds audience habits',
-            'example': 'Regular uploads'
-        })
+        return _CONTENT_TYPES.get(day, _DEFAULT_CONTENT)
     
     def generate_enhanced_calendar(self, weeks: int = 4, videos_per_week: int = 3) -> List[Dict]:
         """Generate an enhanced content calendar with full recommendations."""
@@ -347,91 +500,130 @@ class CalendarOptimizer:
         if 'error' in day_analysis:
             return []
         
-        # Get best days
-        daily_stats = pd.DataFrame(day_analysis['daily_stats'])
-        best_days = daily_stats.nlargest(videos_per_week, 'avg_views').index.tolist()
+        # Get best days straight from the aggregate analyze_best_days built
+        idx = _top_k_indices(self._by_day['avg_views'].to_numpy(), videos_per_week)
+        best_days = self._by_day.index.to_numpy()[idx].tolist()
         
         # Get best hours
         best_hour = hour_analysis.get('best_hour_for_views', 14) if 'error' not in hour_analysis else 14
         
-        # Generate calendar
-        calendar = []
+        # Generate calendar; iterating only the scheduled days (in weekday
+        # order) drops the per-day membership scan over all seven
+        scheduled_days = sorted(best_days, key=DAY_TO_IDX.get)
+
+        # Everything that doesn't depend on the date is invariant across
+        # the loop: hoist the shared fields and resolve each day's content
+        # suggestion and title once
+        time_str = self._format_hour_ampm(best_hour)
+        timezone_display = self.get_timezone_display()
+        patterns_short = title_patterns.get('best_patterns', [])[:3]
+        day_plans = []
+        for day in scheduled_days:
+            day_idx = DAY_TO_IDX[day]
+            content_info = self._suggest_content_type(day, day_idx)
+            day_plans.append((
+                day, day_idx, content_info,
+                self._generate_title_suggestion(content_info['type'], title_patterns)
+            ))
+
+        calendar = [None] * (weeks * len(day_plans))
         start_date = datetime.now().date()
-        days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
+
+        i = 0
         for week in range(weeks):
-            for day_idx, day in enumerate(days_order):
-                if day in best_days:
-                    # Find the next occurrence of this day
-                    current_date = start_date + timedelta(weeks=week)
-                    while current_date.strftime('%A') != day:
-                        current_date += timedelta(days=1)
-                    
-                    content_info = self._suggest_content_type(day, day_idx)
-                    
-                    calendar.append({
-                        'week': week + 1,
-                        'date': current_date.isoformat(),
-                        'date_formatted': current_date.strftime('%B %d, %Y'),
-                        'day': day,
-                        'time': self._format_hour_ampm(best_hour),
-                        'time_24h': best_hour,
-                        'timezone': self.timezone,
-                        'timezone_display': self.get_timezone_display(),
-                        'content_type': content_info['type'],
-                        'content_description': content_info['description'],
-                        'content_reason': content_info['reason'],
-                        'content_example': content_info['example'],
-                        'title_suggestion': self._generate_title_suggestion(content_info['type'], title_patterns),
-                        'title_patterns': title_patterns.get('best_patterns', [])[:3]
-                    })
-        
+            week_start = start_date + timedelta(weeks=week)
+            start_weekday = week_start.weekday()
+            for day, day_idx, content_info, title_suggestion in day_plans:
+                # Next occurrence of this day, by weekday arithmetic
+                current_date = week_start + timedelta(
+                    days=(day_idx - start_weekday) % 7
+                )
+
+                calendar[i] = {
+                    'week': week + 1,
+                    'date': current_date.isoformat(),
+                    'date_formatted': current_date.strftime('%B %d, %Y'),
+                    'day': day,
+                    'time': time_str,
+                    'time_24h': best_hour,
+                    'timezone': self.timezone,
+                    'timezone_display': timezone_display,
+                    'content_type': content_info['type'],
+                    'content_description': content_info['description'],
+                    'content_reason': content_info['reason'],
+                    'content_example': content_info['example'],
+                    'title_suggestion': title_suggestion,
+                    'title_patterns': patterns_short
+                }
+                i += 1
+
         return calendar
     
     def generate_calendar(self, weeks: int = 4, videos_per_week: int = 3) -> List[Dict]:
         """Generate optimized content calendar for the next N weeks."""
         return self.generate_enhanced_calendar(weeks, videos_per_week)
     
+    @_memoized
     def get_upload_frequency_analysis(self) -> Dict:
         """Analyze optimal upload frequency."""
         if self.df.empty:
             return {'error': 'No data available'}
         
-        # Calculate videos per week
-        self.df['week'] = self.df['published_at'].dt.isocalendar().week
-        videos_per_week = self.df.groupby('week').size()
-        
-        # Calculate correlation with views
-        views_by_week = self.df.groupby('week')['views'].mean()
-        
+        # week is derived once at construction
+        if 'week' not in self.df.columns:
+            return {'error': 'No date data available for frequency analysis'}
+
+        # Week numbers are small integers, so bincount does in one pass
+        # what groupby('week') needed full group-index machinery for
+        wk = self.df['week'].to_numpy()
+        counts = np.bincount(wk)
+        active = counts > 0
+        videos_per_week = counts[active]
+
         # Analyze performance at different frequencies
         if len(videos_per_week) > 1:
             avg_videos_per_week = videos_per_week.mean()
             optimal_frequency = int(round(avg_videos_per_week))
-            
+
+            if len(videos_per_week) > 2:
+                views_sum = np.bincount(wk, weights=self.df['views'].to_numpy())
+                views_by_week = views_sum[active] / videos_per_week
+                with np.errstate(invalid='ignore'):
+                    views_correlation = float(np.corrcoef(views_by_week, videos_per_week)[0, 1])
+            else:
+                views_correlation = 0
+
             return {
                 'current_avg_frequency': round(avg_videos_per_week, 2),
                 'recommended_frequency': optimal_frequency,
-                'views_correlation': float(views_by_week.corr(videos_per_week)) if len(videos_per_week) > 2 else 0,
+                'views_correlation': views_correlation,
                 'recommendation': self._get_frequency_recommendation(avg_videos_per_week)
             }
-        
+
         return {'error': 'Not enough data for frequency analysis'}
     
+    @_memoized
     def analyze_seasonal_patterns(self) -> Dict:
         """Analyze seasonal performance patterns."""
         if self.df.empty:
             return {'error': 'No data available'}
         
-        # Group by month
-        self.df['month'] = self.df['published_at'].dt.month
-        by_month = self.df.groupby('month').agg({
-            'views': 'mean',
-            'video_id': 'count'
-        }).rename(columns={'video_id': 'video_count'})
-        
+        # month is derived once at construction
+        marginals = self._time_marginals()
+        if marginals is None:
+            return {'error': 'No date data available for seasonal analysis'}
+
+        # Marginalize the fused tensor over (day, hour)
+        counts, sums = marginals
+        n = counts.sum(axis=(0, 1))
+        active = n > 0
+        by_month = pd.DataFrame({
+            'views': sums['views'].sum(axis=(0, 1))[active] / n[active],
+            'video_count': n[active],
+        }, index=pd.Index(np.arange(1, 13)[active], name='month'))
+
         # Find best months
-        best_month = by_month['views'].idxmax()
+        best_month = by_month.index[np.nanargmax(by_month['views'].to_numpy())]
         
         month_names = {
             1: 'January', 2: 'February', 3: 'March', 4: 'April',
@@ -447,6 +639,14 @@ class CalendarOptimizer:
     
     def get_complete_recommendations(self) -> Dict:
         """Get complete scheduling recommendations."""
+        # Blank-state short circuit: skip all five analyzers and their
+        # per-analyzer error dicts
+        if self.df.empty:
+            return {
+                'error': 'No data',
+                'timezone': self.timezone,
+                'timezone_display': self.get_timezone_display()
+            }
         return {
             'best_days': self.analyze_best_days(),
             'best_hours': self.analyze_best_hours(),
@@ -27,6 +27,7 @@ class YouTubeAnalyticsChatbot:
     def __init__(self, df: pd.DataFrame = None):
         """Initialize chatbot with video data."""
         self.df = df
+        self._df_version = None
         self.conversation_history = []
         self.openai_client = None
         
@@ -45,6 +46,20 @@ class YouTubeAnalyticsChatbot:
             except:
                 self.df = pd.DataFrame()
     
+    def set_df(self, df: pd.DataFrame, version=None):
+        """Swap in new video data only when the version tag actually changes.
+
+        Callers that rerun frequently (the Streamlit pages) pass a key
+        identifying the data snapshot itself (channel id, row count,
+        newest publish), so unchanged data is a no-op. The tag must
+        describe the data, not the session: the instance is shared
+        across sessions via st.cache_resource.
+        """
+        if version is not None and version == self._df_version:
+            return
+        self.df = df
+        self._df_version = version
+
     def add_message(self, role: str, content: str):
         """Add a message to conversation history."""
         self.conversation_history.append({
@@ -69,19 +69,26 @@ class AnalyticsMetrics:
             return pd.DataFrame()
         
         day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
-        # Group by day of week
-        by_day = self.df.groupby('day_of_week').agg({
+
+        # Group on the integer weekday (0..6); int keys aggregate faster than
+        # strings and reindex(range(7)) guarantees Monday-first order
+        if 'published_at' in self.df.columns:
+            day_keys = pd.to_datetime(self.df['published_at']).dt.dayofweek
+        else:
+            day_keys = self.df['day_of_week'].map({day: i for i, day in enumerate(day_order)})
+
+        by_day = self.df.groupby(day_keys).agg({
             'views': 'mean',
             'likes': 'mean',
             'comments': 'mean',
             'engagement_rate': 'mean',
             'video_id': 'count'
         }).rename(columns={'video_id': 'video_count'})
-        
-        # Reorder by day of week
-        by_day = by_day.reindex(day_order)
-        
+
+        # Attach the day labels after aggregation, already in weekday order
+        by_day = by_day.reindex(range(7))
+        by_day.index = pd.Index(day_order, name='day_of_week')
+
         return by_day.reset_index()
     
     def get_performance_by_hour(self) -> pd.DataFrame:
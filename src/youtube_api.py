@@ -8,6 +8,9 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import asyncio
+
+import aiohttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import pandas as pd
@@ -17,6 +20,11 @@ from typing import List, Dict, Optional
 from config.settings import settings
 
 
+# REST endpoints used for concurrent batch fetches (googleapiclient is sync-only)
+VIDEOS_API_URL = 'https://www.googleapis.com/youtube/v3/videos'
+PLAYLIST_ITEMS_API_URL = 'https://www.googleapis.com/youtube/v3/playlistItems'
+
+
 class YouTubeAPI:
     """YouTube Data API client."""
     
@@ -81,6 +89,50 @@ class YouTubeAPI:
         
         return videos[:max_results]
     
+    async def fetch_uploaded_videos_async(self, playlist_id: str, max_results: int = 50) -> List[Dict]:
+        """Page the uploads playlist over a single reused aiohttp session.
+
+        Page tokens chain (each page's token comes from the previous
+        response), so the pages themselves cannot be gathered in parallel;
+        the win here is one connection/TLS handshake for all pages instead
+        of a fresh googleapiclient request per page.
+        """
+        videos = []
+        next_page_token = None
+
+        async with aiohttp.ClientSession() as session:
+            while len(videos) < max_results:
+                params = {
+                    'part': 'snippet,contentDetails',
+                    'playlistId': playlist_id,
+                    'maxResults': min(50, max_results - len(videos)),
+                    'key': self.api_key,
+                }
+                if next_page_token:
+                    params['pageToken'] = next_page_token
+
+                async with session.get(PLAYLIST_ITEMS_API_URL, params=params) as resp:
+                    resp.raise_for_status()
+                    response = await resp.json()
+
+                for item in response.get('items', []):
+                    videos.append({
+                        'video_id': item['contentDetails']['videoId'],
+                        'title': item['snippet']['title'],
+                        'published_at': item['snippet']['publishedAt'],
+                        'thumbnail': item['snippet']['thumbnails'].get('default', {}).get('url', '')
+                    })
+
+                next_page_token = response.get('nextPageToken')
+                if not next_page_token:
+                    break
+
+        return videos[:max_results]
+
+    def get_uploaded_videos_concurrent(self, playlist_id: str, max_results: int = 50) -> List[Dict]:
+        """Synchronous wrapper around fetch_uploaded_videos_async."""
+        return asyncio.run(self.fetch_uploaded_videos_async(playlist_id, max_results))
+
     def get_video_statistics(self, video_id: str) -> dict:
         """Get statistics for a single video."""
         try:
@@ -143,6 +195,64 @@ class YouTubeAPI:
         
         return df
     
+    async def _fetch_video_batch_async(self, session: aiohttp.ClientSession, batch: List[str]) -> List[Dict]:
+        """Fetch one batch of up to 50 video IDs via the REST endpoint."""
+        params = {
+            'part': 'snippet,statistics,contentDetails',
+            'id': ','.join(batch),
+            'key': self.api_key,
+        }
+        async with session.get(VIDEOS_API_URL, params=params) as resp:
+            resp.raise_for_status()
+            response = await resp.json()
+
+        stats = []
+        for item in response.get('items', []):
+            stats.append({
+                'video_id': item['id'],
+                'title': item['snippet']['title'],
+                'published_at': item['snippet']['publishedAt'],
+                'duration': item['contentDetails'].get('duration', 'PT0M0S'),
+                'views': int(item['statistics'].get('viewCount', 0)),
+                'likes': int(item['statistics'].get('likeCount', 0)),
+                'comments': int(item['statistics'].get('commentCount', 0)),
+                'favorites': int(item['statistics'].get('favoriteCount', 0)),
+            })
+        return stats
+
+    async def fetch_video_details_async(self, video_ids: List[str]) -> pd.DataFrame:
+        """Get detailed statistics for videos, fetching all 50-ID batches concurrently."""
+        chunks = [video_ids[i:i+50] for i in range(0, len(video_ids), 50)]
+
+        async with aiohttp.ClientSession() as session:
+            responses = await asyncio.gather(
+                *[self._fetch_video_batch_async(session, chunk) for chunk in chunks],
+                return_exceptions=True
+            )
+
+        all_stats = []
+        for response in responses:
+            if isinstance(response, Exception):
+                print(f"Error fetching video batch: {response}")
+                continue
+            all_stats.extend(response)
+
+        df = pd.DataFrame(all_stats)
+
+        # Parse duration
+        if not df.empty:
+            df['duration_seconds'] = df['duration'].apply(self._parse_duration)
+            df['published_at'] = pd.to_datetime(df['published_at'])
+
+        return df
+
+    def get_video_details_concurrent(self, video_ids: List[str]) -> pd.DataFrame:
+        """Synchronous wrapper around fetch_video_details_async for non-async callers."""
+        if not video_ids:
+            return pd.DataFrame()
+
+        return asyncio.run(self.fetch_video_details_async(video_ids))
+
     def _parse_duration(self, duration: str) -> int:
         """Parse YouTube duration format (PT1H30M45S) to seconds."""
         import re